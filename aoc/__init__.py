@@ -0,0 +1 @@
+# Shared helpers for the daily solutions in dayNN/code.py
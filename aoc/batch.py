@@ -0,0 +1,72 @@
+import argparse
+import fnmatch
+import glob
+import json
+import multiprocessing
+import os
+import sys
+
+from aoc import days, lazy, runner
+
+
+def find_inputs(patterns):
+    # Directories contribute every .txt file inside them, anything else is a glob
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths += sorted(glob.glob(os.path.join(pattern, "*.txt")))
+        else:
+            paths += sorted(glob.glob(pattern))
+    return [os.path.abspath(path) for path in dict.fromkeys(paths)]
+
+
+def warm_up(day):
+    # Runs once per worker: import the day and anything it imports lazily. A
+    # missing optional dependency only fails the solves that use it; raising
+    # here would make the pool respawn workers forever.
+    module = days.load_day(day)
+    for value in vars(module).values():
+        try:
+            lazy.resolve(value)
+        except ImportError:
+            pass
+
+
+def solve(task):
+    day, part, function_name, path = task
+    result = runner.run_function(day, function_name, path, fresh_models=False)
+    outcome = {"error": result["error"]} if result["error"] else {"answer": result["answer"]}
+    return {"file": path, "part": part, "function": function_name, **outcome, "time": round(result["wall"], 6)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve one day over many input files in a process pool")
+    parser.add_argument("day")
+    parser.add_argument("inputs", nargs="+", help="input directories or glob patterns")
+    parser.add_argument("-f", "--functions", nargs="+", default=["compute_part_?"], help="function name patterns")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("-c", "--chunksize", type=int, default=None, help="input files handed to a worker at once")
+    parser.add_argument("--no-cache", action="store_true", help="bypass the on-disk answer cache")
+    args = parser.parse_args(argv)
+    if args.no_cache:
+        os.environ["AOC_NO_CACHE"] = "1"
+
+    functions = [(part, name) for part, name in days.find_functions(args.day)
+                 if any(fnmatch.fnmatch(name, pattern) for pattern in args.functions)]
+    paths = find_inputs(args.inputs)
+    tasks = [(args.day, part, name, path) for path in paths for part, name in functions]
+    workers = args.workers or os.cpu_count()
+    # Tasks are file-major and chunks hold whole files, so a worker solves every
+    # part of a file in a row and parses it only once
+    files_per_chunk = args.chunksize or max(1, len(paths) // (4 * workers))
+    chunksize = files_per_chunk * max(1, len(functions))
+    failed = 0
+    with multiprocessing.Pool(workers, initializer=warm_up, initargs=(args.day,)) as pool:
+        for result in pool.imap_unordered(solve, tasks, chunksize):
+            failed += "error" in result
+            print(json.dumps(result, default=str), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import argparse
+import contextlib
+import glob
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+from aoc import cache, days, generate, models
+
+DEFAULT_BASELINE = os.path.join(days.ROOT, "benchmarks", "baseline.json")
+DEFAULT_INPUTS = ["sample_input*.txt", "input.txt"]
+
+
+def time_call(function, input_file_name):
+    # Every call parses and builds its indexes again, as a fresh run would
+    models.clear_all()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        answer = function(input_file_name)
+        return time.perf_counter() - start, answer
+
+
+def percentile(samples, q):
+    # Nearest-rank percentile, stable for the small sample counts used here
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def benchmark(function, input_file_name, warmup=1, repeats=5):
+    for _ in range(warmup):
+        time_call(function, input_file_name)
+    samples, answer = [], None
+    for _ in range(repeats):
+        elapsed, answer = time_call(function, input_file_name)
+        samples.append(elapsed)
+    return {
+        "answer": answer if isinstance(answer, (int, float, str)) else repr(answer),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "min": min(samples),
+        "repeats": repeats,
+    }
+
+
+def find_inputs(day, patterns, scales=()):
+    # [(label, input file)] for matching files in the day directory and generated inputs
+    day_dir = days.input_path(day, "")
+    inputs = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(day_dir, pattern))):
+            name = os.path.relpath(path, day_dir)
+            if (name, name) not in inputs:
+                inputs.append((name, name))
+    for scale in scales:
+        if day in generate.GENERATORS:
+            inputs.append((f"generated-x{scale:g}", generate.write_input(day, scale)))
+    return inputs
+
+
+def compare(results, baseline, ratio):
+    regressions, changed = [], []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        if result["median"] > ratio * baseline[key]["median"]:
+            regressions.append((key, baseline[key]["median"], result["median"]))
+        if result["answer"] != baseline[key]["answer"]:
+            changed.append((key, baseline[key]["answer"], result["answer"]))
+    return regressions, changed
+
+
+def load_baseline(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark compute_part_* functions against a stored baseline")
+    parser.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    parser.add_argument("-f", "--functions", nargs="+", default=days.DEFAULT_PATTERNS,
+                        help="function name patterns (variants infeasible on real inputs only run when named here)")
+    parser.add_argument("-i", "--inputs", nargs="+", default=DEFAULT_INPUTS, help="input file globs inside each day directory")
+    parser.add_argument("-s", "--scales", nargs="+", type=float, default=[], help="also run on generated inputs of these scales")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--ratio", type=float, default=1.5, help="fail when median > ratio * baseline median")
+    parser.add_argument("--save", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+    cache.disable()
+
+    results = {}
+    for day in args.days or days.find_days():
+        module = days.load_day(day)
+        for _, function_name in days.select_functions(day, args.functions):
+            for label, input_file_name in find_inputs(day, args.inputs, args.scales):
+                key = f"{day}.{function_name}:{label}"
+                results[key] = benchmark(getattr(module, function_name), input_file_name, args.warmup, args.repeats)
+                print(f"{key:60} median {results[key]['median']:.6f}s  p95 {results[key]['p95']:.6f}s", flush=True)
+
+    baseline = load_baseline(args.baseline)
+    if args.save:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    regressions, changed = compare(results, baseline, args.ratio)
+    for key, before, after in regressions:
+        print(f"REGRESSION {key}: {before:.6f}s -> {after:.6f}s ({after / before:.2f}x)")
+    for key, before, after in changed:
+        print(f"CHANGED ANSWER {key}: {before} -> {after}")
+    return 1 if regressions or changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
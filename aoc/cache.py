@@ -0,0 +1,151 @@
+import argparse
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sqlite3
+import time
+
+from aoc import days, loader
+
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(days.ROOT, ".cache"))
+DATABASE = os.path.join(CACHE_DIR, "answers.sqlite3")
+MAX_BYTES = 64 * 1024 * 1024
+MAX_AGE = 30 * 24 * 3600
+# Shared modules that answers depend on besides the day's own code
+SHARED_SOURCES = [os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+                  for name in ("loader", "tokenize", "models", "checkpoint")]
+
+ENABLED = True
+
+
+def enabled():
+    return ENABLED and not os.environ.get("AOC_NO_CACHE")
+
+
+def disable():
+    # Benchmarks and other timing tools must never see cached answers
+    global ENABLED
+    ENABLED = False
+
+
+def hash_file(path):
+    return hashlib.sha256(loader.read_buffer(path)).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def hash_source(path, mtime):
+    return hash_file(path)
+
+
+def source_hash(module_file):
+    # Changes to the day's module or to any shared parsing code invalidate its answers
+    digest = hashlib.sha256()
+    for path in [module_file] + SHARED_SOURCES:
+        digest.update(hash_source(path, os.path.getmtime(path)).encode())
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def connect():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(DATABASE, timeout=30)
+    try:
+        with connection:
+            connection.execute("""CREATE TABLE IF NOT EXISTS answers (
+                day TEXT, part INTEGER, function TEXT, input_hash TEXT, source_hash TEXT,
+                answer BLOB, size INTEGER, created REAL, accessed REAL,
+                PRIMARY KEY (day, part, function, input_hash, source_hash))""")
+            yield connection
+    finally:
+        connection.close()
+
+
+def get(key):
+    with connect() as connection:
+        row = connection.execute("SELECT answer FROM answers WHERE day=? AND part=? AND function=? "
+                                 "AND input_hash=? AND source_hash=?", key).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE answers SET accessed=? WHERE day=? AND part=? AND function=? "
+                           "AND input_hash=? AND source_hash=?", (time.time(), *key))
+        return pickle.loads(row[0])
+
+
+def put(key, answer):
+    blob = pickle.dumps(answer)
+    now = time.time()
+    with connect() as connection:
+        connection.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           (*key, blob, len(blob), now, now))
+    evict(MAX_BYTES, MAX_AGE)
+
+
+def evict(max_bytes=None, max_age=None):
+    # Drop entries not used within max_age seconds, then the least recently
+    # used ones until the stored answers fit into max_bytes
+    with connect() as connection:
+        if max_age is not None:
+            connection.execute("DELETE FROM answers WHERE accessed < ?", (time.time() - max_age,))
+        if max_bytes is not None:
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+            rows = connection.execute("SELECT rowid, size FROM answers ORDER BY accessed").fetchall()
+            for rowid, size in rows:
+                if total <= max_bytes:
+                    break
+                connection.execute("DELETE FROM answers WHERE rowid=?", (rowid,))
+                total -= size
+
+
+def cached(function):
+    # Memoize compute_part_*(input_file_name) on disk, keyed by the input bytes
+    # and the source of the module defining it plus the shared parsing code
+    module_file = os.path.abspath(function.__globals__["__file__"])
+    day = os.path.basename(os.path.dirname(module_file))
+    part = int(re.match(r"compute_part_(\d)", function.__name__).group(1))
+    # Keep the wrapped function's own default input (some variants default to the sample)
+    (parameter,) = inspect.signature(function).parameters.values()
+    default = "input.txt" if parameter.default is parameter.empty else parameter.default
+
+    @functools.wraps(function)
+    def wrapper(input_file_name=default):
+        if not enabled():
+            return function(input_file_name)
+        input_file = os.path.join(os.path.dirname(module_file), input_file_name)
+        key = (day, part, function.__name__, hash_file(input_file), source_hash(module_file))
+        try:
+            answer = get(key)
+        except sqlite3.Error:
+            return function(input_file_name)
+        if answer is None:
+            answer = function(input_file_name)
+            try:
+                put(key, answer)
+            except sqlite3.Error:
+                pass
+        return answer
+
+    return wrapper
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and evict the answer cache")
+    parser.add_argument("--max-size-mb", type=float, help="evict least recently used answers beyond this size")
+    parser.add_argument("--max-age-days", type=float, help="evict answers not used for this many days")
+    parser.add_argument("--clear", action="store_true", help="remove every cached answer")
+    args = parser.parse_args(argv)
+    if args.clear:
+        evict(max_bytes=0)
+    elif args.max_size_mb is not None or args.max_age_days is not None:
+        evict(None if args.max_size_mb is None else args.max_size_mb * 1024 * 1024,
+              None if args.max_age_days is None else args.max_age_days * 24 * 3600)
+    with connect() as connection:
+        n, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers").fetchone()
+    print(f"{n} cached answers, {size} bytes in {DATABASE}")
+
+
+if __name__ == "__main__":
+    main()
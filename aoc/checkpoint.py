@@ -0,0 +1,70 @@
+import os
+import pickle
+import time
+
+from aoc import cache
+
+CHECKPOINT_DIR = os.path.join(cache.CACHE_DIR, "checkpoints")
+INTERVAL = 5.0
+
+
+class Checkpoint:
+    # Search state of one long loop, kept on disk while the loop runs so an
+    # interrupted run of the same code on the same input resumes from it:
+    #
+    #     with checkpoint.Checkpoint(__file__, "compute_part_2", input_file_name) as cp:
+    #         state = cp.state or {"i": 0, "best": 0}
+    #         for i in range(state["i"], n):
+    #             ...
+    #             cp.update({"i": i + 1, "best": best})
+    #
+    # The state is written at most every INTERVAL seconds and when the loop
+    # raises (including KeyboardInterrupt), and deleted once it finishes.
+    # Runs with the cache off (timing tools, $AOC_NO_CACHE) never resume.
+    def __init__(self, module_file, name, input_file_name):
+        module_file = os.path.abspath(module_file)
+        day = os.path.basename(os.path.dirname(module_file))
+        input_file = os.path.join(os.path.dirname(module_file), input_file_name)
+        self.enabled = cache.enabled()
+        self.path = os.path.join(CHECKPOINT_DIR, f"{day}-{name}-{cache.hash_file(input_file)[:24]}-"
+                                 f"{cache.hash_source(module_file, os.path.getmtime(module_file))[:12]}.pickle")
+        self.state = self.load() if self.enabled else None
+        self.latest = None
+        self.next_save = time.monotonic() + INTERVAL
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.clear()
+        elif self.latest is not None:
+            self.save(self.latest)
+        return False
+
+    def load(self):
+        try:
+            with open(self.path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def update(self, state):
+        # Cheap enough to call on every outer iteration
+        self.latest = state
+        now = time.monotonic()
+        if now >= self.next_save:
+            self.save(state)
+            self.next_save = now + INTERVAL
+
+    def save(self, state):
+        if not self.enabled:
+            return
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+        with open(self.path + ".tmp", "wb") as f:
+            pickle.dump(state, f)
+        os.replace(self.path + ".tmp", self.path)
+
+    def clear(self):
+        if self.enabled and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import socket
+import sys
+
+# Only the standard library is imported here: the client's startup is the latency of a warm solve
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOCKET = os.environ.get("AOC_DAEMON_SOCKET",
+                        os.path.join(os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".cache")), "daemon.sock"))
+
+
+def request(message, path=SOCKET):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve one part through the warm daemon (python -m aoc.daemon)")
+    parser.add_argument("day", help="day to solve, or 'stop' to shut the daemon down")
+    parser.add_argument("part", type=int, nargs="?", default=1)
+    parser.add_argument("input", nargs="?", default="-", help="input file (default: send stdin)")
+    parser.add_argument("-f", "--function", help="function to call instead of compute_part_PART")
+    parser.add_argument("--socket", default=SOCKET, help="socket path (default: $AOC_DAEMON_SOCKET or .cache/daemon.sock)")
+    args = parser.parse_args(argv)
+
+    if args.day == "stop":
+        message = {"command": "stop"}
+    else:
+        message = {"day": args.day, "part": args.part, "function": args.function}
+        if args.input == "-":
+            message["data"] = sys.stdin.read()
+        else:
+            message["input"] = os.path.abspath(args.input)
+    try:
+        response = request(message, args.socket)
+    except OSError as e:
+        sys.exit(f"No daemon on {args.socket}: {e}")
+    if "error" in response:
+        sys.exit(response["error"])
+    if args.day != "stop":
+        print(response["answer"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
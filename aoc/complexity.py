@@ -0,0 +1,105 @@
+import argparse
+import csv
+import fnmatch
+import math
+import os
+import sys
+
+from aoc import bench, cache, days, generate
+
+DEFAULT_OUTPUT = os.path.join(days.ROOT, "benchmarks", "complexity")
+DEFAULT_SCALES = [0.125, 0.25, 0.5, 1]
+# Fitted exponents are noisy on small ladders, so a part is flagged only this far above its budget
+TOLERANCE = 0.3
+
+# Declared growth of each part as an exponent of the input size n:
+# runtime ~ n ** budget. Parts missing here are expected to be linear.
+BUDGETS = {
+    "day05.compute_part_1": 2,    # every ingredient against every range
+    "day05.compute_part_2": 2,    # merging ranges pairwise
+    "day08.compute_part_1": 2,    # all pairs of boxes
+    "day08.compute_part_2": 2,
+    "day09.compute_part_1": 2,    # all pairs of red tiles
+    "day09.compute_part_2": 3,    # all pairs of red tiles, each against every edge
+    "day09.compute_part_2_inefficient": 4,
+}
+
+
+def fit_exponent(sizes, times):
+    # Least-squares slope of log(time) against log(size)
+    xs, ys = [math.log(size) for size in sizes], [math.log(max(time, 1e-9)) for time in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return float("nan")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def measure(module, function_name, day, scales, repeats):
+    points = []
+    for scale in scales:
+        input_file = generate.write_input(day, scale)
+        # A fresh parse per run, otherwise the memoized model hides the parsing cost
+        parse = getattr(module, "parse", None)
+        function = getattr(module, function_name)
+        samples = []
+        for _ in range(repeats):
+            parse and parse.cache_clear()
+            samples.append(bench.time_call(function, input_file)[0])
+        points.append((scale, os.path.getsize(input_file), min(samples)))
+    return points
+
+
+def write_reports(rows, output):
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    columns = ["function", "budget", "exponent", "status", "scales", "sizes", "times"]
+    with open(output + ".csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(output + ".md", "w") as f:
+        f.write("| function | budget | fitted exponent | status | largest input | time |\n")
+        f.write("|---|---|---|---|---|---|\n")
+        for row in rows:
+            f.write(f"| {row['function']} | n^{row['budget']:g} | {row['exponent']:.2f} | {row['status']} | "
+                    f"{row['sizes'].split()[-1]} bytes | {float(row['times'].split()[-1]):.4f}s |\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit runtime against generated input size and check complexity budgets")
+    parser.add_argument("days", nargs="*", help="days to measure (default: every day with a generator)")
+    parser.add_argument("-f", "--functions", nargs="+", default=["compute_part_?"], help="function name patterns")
+    parser.add_argument("-s", "--scales", nargs="+", type=float, default=DEFAULT_SCALES, help="input scale ladder")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per scale, the fastest one counts")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed excess over the budget exponent")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="report path without extension (.csv and .md are written)")
+    args = parser.parse_args(argv)
+    cache.disable()
+
+    rows = []
+    for day in args.days or sorted(generate.GENERATORS):
+        module = days.load_day(day)
+        for _, function_name in days.find_functions(day):
+            if not any(fnmatch.fnmatch(function_name, pattern) for pattern in args.functions):
+                continue
+            key = f"{day}.{function_name}"
+            points = measure(module, function_name, day, args.scales, args.repeats)
+            budget = BUDGETS.get(key, 1)
+            exponent = fit_exponent([size for _, size, _ in points], [time for _, _, time in points])
+            status = "OVER BUDGET" if exponent > budget + args.tolerance else "ok"
+            rows.append({"function": key, "budget": budget, "exponent": round(exponent, 3), "status": status,
+                         "scales": " ".join(f"{scale:g}" for scale, _, _ in points),
+                         "sizes": " ".join(str(size) for _, size, _ in points),
+                         "times": " ".join(f"{time:.6f}" for _, _, time in points)})
+            print(f"{key:40} n^{exponent:.2f}  budget n^{budget:g}  {status}", flush=True)
+
+    write_reports(rows, args.output)
+    print(f"Report written to {args.output}.csv and {args.output}.md")
+    over = [row for row in rows if row["status"] != "ok"]
+    if over:
+        print(f"{len(over)} parts over their complexity budget")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import socketserver
+import sys
+import threading
+
+from aoc import batch, cache, client, days, runner
+
+INPUT_DIR = os.path.join(cache.CACHE_DIR, "daemon")
+
+
+def warm_up(selected_days):
+    # Runs once per worker, so solves never pay for imports. A day that fails to
+    # import is left for its solves to report; raising here would make the
+    # pool respawn workers forever and block every request.
+    for day in selected_days:
+        try:
+            batch.warm_up(day)
+        except Exception:
+            pass
+
+
+def store_input(data):
+    # Inputs sent as text are written once under their hash, which keeps the
+    # answer cache and the workers' parsed models keyed by content
+    path = os.path.join(INPUT_DIR, hashlib.sha256(data.encode()).hexdigest() + ".txt")
+    if not os.path.isfile(path):
+        os.makedirs(INPUT_DIR, exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+class Handler(socketserver.StreamRequestHandler):
+    # One JSON request per line, answered by one JSON line
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.dispatch(json.loads(line))
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, pool):
+        self.pool = pool
+        super().__init__(path, Handler)
+
+    def dispatch(self, request):
+        if request.get("command") == "stop":
+            threading.Thread(target=self.shutdown).start()
+            return {"stopped": True}
+        if request.get("command") == "ping":
+            return {"pid": os.getpid()}
+        day = request["day"]
+        function_name = request.get("function") or f"compute_part_{request['part']}"
+        path = store_input(request["data"]) if "data" in request else os.path.abspath(request["input"])
+        result = self.pool.apply(runner.run_function, (day, function_name, path), {"fresh_models": False})
+        if result["error"]:
+            return {"error": result["error"]}
+        return {"day": day, "function": function_name, "answer": result["answer"], "time": result["wall"]}
+
+
+def serve(path, selected_days, workers=None):
+    if os.path.exists(path):
+        try:
+            client.request({"command": "ping"}, path)
+            sys.exit(f"A daemon is already listening on {path}")
+        except OSError:
+            os.unlink(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # The pool is started before the server threads, so workers fork from a single-threaded process
+    with multiprocessing.Pool(workers, initializer=warm_up, initargs=(selected_days,)) as pool:
+        with Server(path, pool) as server:
+            print(f"Serving {len(selected_days)} days on {path}", flush=True)
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep every day imported in a warm worker pool behind a Unix socket; "
+                                     "solve through it with python -m aoc.client")
+    parser.add_argument("days", nargs="*", help="days to keep imported (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--socket", default=client.SOCKET, help="socket path (default: $AOC_DAEMON_SOCKET or .cache/daemon.sock)")
+    args = parser.parse_args(argv)
+    serve(args.socket, args.days or days.find_days(), args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import fnmatch
+import importlib
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PART_FUNCTION = re.compile(r"^def (compute_part_(\d)\w*)\(", re.MULTILINE)
+DEFAULT_PATTERNS = ["compute_part_*"]
+# Variants that exhaust time or memory on the real input; they only run when a
+# function pattern other than the default one matches them
+EXPLICIT_ONLY = {("day02", "compute_part_2_brute_force"), ("day09", "compute_part_2_inefficient")}
+
+
+def find_days():
+    return sorted(name for name in os.listdir(ROOT)
+                  if re.fullmatch(r"day\d\d", name) and os.path.isfile(os.path.join(ROOT, name, "code.py")))
+
+
+def find_functions(day):
+    # Read the source instead of importing it, so listing parts stays cheap
+    with open(os.path.join(ROOT, day, "code.py")) as f:
+        return [(int(part), name) for name, part in PART_FUNCTION.findall(f.read())]
+
+
+def select_functions(day, patterns=DEFAULT_PATTERNS):
+    def requested(name, explicit):
+        return any(fnmatch.fnmatch(name, pattern) for pattern in patterns
+                   if not explicit or pattern not in DEFAULT_PATTERNS)
+    return [(part, name) for part, name in find_functions(day)
+            if requested(name, (day, name) in EXPLICIT_ONLY)]
+
+
+def load_day(day):
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return importlib.import_module(f"{day}.code")
+
+
+def input_path(day, input_file_name):
+    return os.path.join(ROOT, day, input_file_name)
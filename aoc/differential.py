@@ -0,0 +1,95 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from aoc import bench, cache, days, generate
+
+DEFAULT_OUTPUT = os.path.join(days.ROOT, "benchmarks", "differential.json")
+# The exact search in day12.can_fit is exponential, so only small regions are checked
+MAX_REGION_AREA = 30
+
+
+def timed(module, function_name, input_file):
+    # Both sides parse from scratch, so the shared model cache favours neither
+    getattr(module, "parse", None) and module.parse.cache_clear()
+    return bench.time_call(getattr(module, function_name), input_file)
+
+
+def compare_files(module, reference, fast, input_file):
+    reference_time, reference_answer = timed(module, reference, input_file)
+    fast_time, fast_answer = timed(module, fast, input_file)
+    return reference_answer, fast_answer, reference_time, fast_time
+
+
+def compare_regions(module, reference, fast, input_file):
+    # One verdict per region, so a single disagreeing region shows up
+    model = module.parse(input_file)
+    reference_answer, fast_answer, reference_time, fast_time = [], [], 0, 0
+    for (width, height), requirements in model.regions:
+        if width * height > MAX_REGION_AREA:
+            continue
+        start = time.perf_counter()
+        reference_answer.append(getattr(module, reference)(model.shapes, list(requirements),
+                                                           module.np.full((height, width), "."), width, height))
+        reference_time += time.perf_counter() - start
+        start = time.perf_counter()
+        fast_answer.append(getattr(module, fast)(model.shapes, list(requirements), width, height))
+        fast_time += time.perf_counter() - start
+    return reference_answer, fast_answer, reference_time, fast_time
+
+
+# (day, reference, fast, compare, scales)
+PAIRS = [
+    # x70 is past day01.NUMPY_MIN_ROTATIONS, so the vectorized engine is checked too
+    ("day01", "compute_part_2_dummy", "compute_part_2", compare_files, (0.1, 1, 70)),
+    ("day02", "compute_part_1_brute_force", "compute_part_1", compare_files, (0.1, 1)),
+    ("day02", "compute_part_2_brute_force", "compute_part_2", compare_files, (0.05, 0.2)),
+    ("day09", "compute_part_2_inefficient", "compute_part_2", compare_files, (0.02, 0.04)),
+    ("day12", "can_fit", "dummy_can_fit", compare_regions, (0.01, 0.03)),
+]
+
+
+def describe(answer):
+    return f"{sum(answer)}/{len(answer)} fit" if isinstance(answer, list) else answer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check reference implementations against their fast counterparts")
+    parser.add_argument("days", nargs="*", help="days to check (default: every day with a pair)")
+    parser.add_argument("-s", "--scales", nargs="+", type=float, help="generated input scales (default: per pair)")
+    parser.add_argument("--seeds", type=int, default=3, help="generated inputs per scale")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file for the measured speedups")
+    parser.add_argument("--save", action="store_true", help="record the median speedup per pair and scale")
+    args = parser.parse_args(argv)
+    cache.disable()
+
+    mismatches, speedups = 0, {}
+    for day, reference, fast, compare, scales in PAIRS:
+        if args.days and day not in args.days:
+            continue
+        module = days.load_day(day)
+        for scale in args.scales or scales:
+            ratios = []
+            for seed in range(args.seeds):
+                input_file = generate.write_input(day, scale, seed)
+                reference_answer, fast_answer, reference_time, fast_time = compare(module, reference, fast, input_file)
+                ratios.append(reference_time / fast_time if fast_time else float("inf"))
+                status = "ok" if reference_answer == fast_answer else "MISMATCH"
+                mismatches += reference_answer != fast_answer
+                print(f"{day} {reference} vs {fast}  x{scale:g} seed {seed}  {status:8}  "
+                      f"{describe(reference_answer)} / {describe(fast_answer)}  "
+                      f"{reference_time:.4f}s / {fast_time:.4f}s  speedup {ratios[-1]:.1f}x", flush=True)
+            speedups[f"{day}.{reference}~{fast}:x{scale:g}"] = statistics.median(ratios)
+
+    if args.save:
+        bench.save_baseline(args.output, {**bench.load_baseline(args.output), **speedups})
+        print(f"Speedups written to {args.output}")
+    if mismatches:
+        print(f"{mismatches} mismatching inputs")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+import argparse
+import math
+import os
+import random
+import string
+
+from aoc import days
+
+GENERATED_DIR = os.path.join(days.ROOT, ".cache", "generated")
+
+
+def count(base, scale, minimum=1):
+    return max(minimum, round(base * scale))
+
+
+def day01(rng, scale):
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(count(4000, scale)))
+
+
+def day02(rng, scale):
+    id_ranges = []
+    for _ in range(count(35, scale)):
+        n_digits = rng.randint(2, 10)
+        start = rng.randint(10**(n_digits-1), 10**n_digits - 1)
+        id_ranges.append(f"{start}-{start + rng.randint(0, 100000)}")
+    return ",".join(id_ranges)
+
+
+def day03(rng, scale):
+    return "\n".join("".join(rng.choice("123456789") for _ in range(100)) for _ in range(count(200, scale)))
+
+
+def day04(rng, scale):
+    side = count(137, math.sqrt(scale), 3)
+    return "\n".join("".join("@" if rng.random() < 0.65 else "." for _ in range(side)) for _ in range(side))
+
+
+def day05(rng, scale):
+    id_ranges = []
+    for _ in range(count(186, scale)):
+        if id_ranges and rng.random() < 0.1:
+            # Some ranges lie completely inside others
+            outer_start, outer_stop = rng.choice(id_ranges)
+            start = rng.randint(outer_start, outer_stop)
+            id_ranges.append((start, rng.randint(start, outer_stop)))
+        else:
+            start = rng.randint(1, 560000000000000)
+            id_ranges.append((start, start + rng.randint(0, 5000000000000)))
+    ingredients = []
+    for _ in range(count(1000, scale)):
+        if rng.random() < 0.5:
+            ingredients.append(rng.randint(*rng.choice(id_ranges)))
+        else:
+            ingredients.append(rng.randint(1, 565000000000000))
+    return "\n".join([f"{start}-{stop}" for start, stop in id_ranges] + [""] + [str(id) for id in ingredients])
+
+
+def day06(rng, scale):
+    n_rows = 4
+    blocks = []
+    for _ in range(count(1000, scale)):
+        numbers = [str(rng.randint(1, 10**rng.randint(1, 4) - 1)) for _ in range(n_rows)]
+        width = max(len(number) for number in numbers)
+        align = str.rjust if rng.random() < 0.5 else str.ljust
+        blocks.append([align(number, width) for number in numbers] + [rng.choice("+*").ljust(width)])
+    return "\n".join(" ".join(block[row] for block in blocks) for row in range(n_rows + 1))
+
+
+def day07(rng, scale):
+    width = count(141, math.sqrt(scale), 5) | 1
+    height = width + 1
+    start = width // 2
+    map = [["."] * width for _ in range(height)]
+    map[0][start] = "S"
+    map[2][start] = "^"
+    for l in range(4, height, 2):
+        # Splitters fan out below S where beams can arrive, never adjacent or on the border
+        spread = l // 2 - 1
+        for i in range(max(1, start - spread), min(width - 1, start + spread + 1)):
+            if (i - start - spread) % 2 == 0 and rng.random() < 0.5:
+                map[l][i] = "^"
+    return "\n".join("".join(row) for row in map)
+
+
+def day08(rng, scale):
+    points = set()
+    while len(points) < count(1000, scale, 46):
+        points.add(tuple(rng.randint(0, 99999) for _ in range(3)))
+    points = list(points)
+    rng.shuffle(points)
+    return "\n".join(",".join(str(x) for x in point) for point in points)
+
+
+def day09(rng, scale):
+    # Red tiles on a staircase approximation of a circle: closed, rectilinear
+    # and orthogonally convex. The coordinate range grows with the vertex count.
+    k = count(250, scale, 8)
+    radius = max(2 * k, round(0.8 * k * k))
+    centre = radius + 1
+    while True:
+        angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(k))
+        points = [(centre + round(radius * math.cos(a)), centre + round(radius * math.sin(a))) for a in angles]
+        vertices = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if not vertices or vertices[-1] != (x1, y1):
+                vertices.append((x1, y1))
+            if x1 != x2 and y1 != y2:
+                vertices.append(max([(x1, y2), (x2, y1)], key=lambda c: (c[0]-centre)**2 + (c[1]-centre)**2))
+        # Drop repeated and collinear vertices so every red tile is a corner
+        changed = True
+        while changed:
+            changed = False
+            for j in range(len(vertices)):
+                prev, curr, next = vertices[j-1], vertices[j], vertices[(j+1) % len(vertices)]
+                if curr == prev or (prev[0] == curr[0] == next[0]) or (prev[1] == curr[1] == next[1]):
+                    del vertices[j]
+                    changed = True
+                    break
+        # Rounding and wide gaps between angles can still fold the outline; draw again
+        if is_simple_rectilinear(vertices):
+            return "\n".join(f"{x},{y}" for x, y in vertices)
+
+
+def is_simple_rectilinear(vertices):
+    # Every edge axis-parallel and no two edges touching except consecutive ones at their corner
+    n = len(vertices)
+    if n < 4:
+        return False
+    edges = []
+    for j in range(n):
+        (x1, y1), (x2, y2) = vertices[j], vertices[(j+1) % n]
+        if x1 != x2 and y1 != y2:
+            return False
+        edges.append((min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2)))
+    # Axis-parallel segments meet exactly when their bounding boxes overlap
+    order = sorted(range(n), key=lambda j: edges[j][0])
+    for a, i in enumerate(order):
+        x_lo, x_hi, y_lo, y_hi = edges[i]
+        for j in order[a+1:]:
+            if edges[j][0] > x_hi:
+                break
+            if abs(i - j) in (1, n - 1):
+                continue
+            if edges[j][2] <= y_hi and y_lo <= edges[j][3]:
+                return False
+    return True
+
+
+def day10(rng, scale):
+    machines = []
+    for _ in range(count(175, scale)):
+        n_lights = rng.randint(4, 10)
+        buttons = [set(rng.sample(range(n_lights), rng.randint(1, n_lights))) for _ in range(rng.randint(3, 13))]
+        for light in range(n_lights):
+            if not any(light in button for button in buttons):
+                rng.choice(buttons).add(light)
+        # Derive the target from actual presses so both parts are solvable
+        diagram = ["."] * n_lights
+        joltages = [0] * n_lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltages[light] += presses
+                if presses % 2:
+                    diagram[light] = "#" if diagram[light] == "." else "."
+        machines.append(f"[{''.join(diagram)}] "
+                        + " ".join("(" + ",".join(str(x) for x in sorted(button)) + ")" for button in buttons)
+                        + " {" + ",".join(str(x) for x in joltages) + "}")
+    return "\n".join(machines)
+
+
+def day11(rng, scale):
+    # Devices are arranged in layers that only connect forward, so the graph is
+    # acyclic and shallow. A spine through every layer keeps svr -> fft -> dac ->
+    # out connected, and the short tail after "you" keeps part 1's path count small.
+    n_layers, n_tail = 16, 12
+    width = count(36, scale)
+    reserved = {"svr", "fft", "dac", "you", "out"}
+    length = 3 if n_layers * width + n_tail < 10000 else 4
+    names = set()
+    while len(names) < n_layers * width + n_tail:
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        if name not in reserved:
+            names.add(name)
+    names = sorted(names)
+    rng.shuffle(names)
+    layers = [names[l*width:(l+1)*width] for l in range(n_layers)]
+    tail = ["you"] + names[n_layers*width:n_layers*width + n_tail - 1] + ["out"]
+    layers[0] = ["svr"]
+    spine = [rng.choice(layer) for layer in layers]
+    checkpoints = ["fft", "dac"]
+    rng.shuffle(checkpoints)
+    for l, checkpoint in [(n_layers // 3, checkpoints[0]), (2 * n_layers // 3, checkpoints[1])]:
+        layers[l][layers[l].index(spine[l])] = spine[l] = checkpoint
+    devices = {}
+    for l, layer in enumerate(layers):
+        targets = layers[l + 1] if l + 1 < n_layers else tail
+        for name in layer:
+            devices[name] = set(rng.sample(targets, min(len(targets), rng.randint(1, 3))))
+        if l + 1 < n_layers:
+            devices[spine[l]].add(spine[l + 1])
+    devices[spine[-1]].add("out")
+    for i, name in enumerate(tail[:-1]):
+        devices[name] = {tail[i + 1]} | set(rng.sample(tail[i + 1:], min(len(tail) - i - 1, rng.randint(0, 2))))
+    lines = [f"{name}: " + " ".join(sorted(outputs)) for name, outputs in devices.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day12(rng, scale):
+    # Regions either fit every present in its own 3x3 slot or lack the area for
+    # them, so the area check and the exact search agree on every region.
+    lines = []
+    shape_areas = []
+    for idx in range(6):
+        cells = set(rng.sample(range(9), rng.randint(5, 8)))
+        shape_areas.append(len(cells))
+        lines += [f"{idx}:"] + ["".join("#" if 3*r + c in cells else "." for c in range(3)) for r in range(3)] + [""]
+    side = count(45, math.sqrt(scale), 3)
+    for _ in range(count(1000, scale)):
+        width, height = rng.randint(max(3, side - 9), side + 5), rng.randint(max(3, side - 9), side + 5)
+        counts = [0] * 6
+        if rng.random() < 0.5:
+            slots = (width // 3) * (height // 3)
+            for _ in range(rng.randint((slots + 1) // 2, slots)):
+                counts[rng.randrange(6)] += 1
+        else:
+            while sum(shape_areas[i] * counts[i] for i in range(6)) <= width * height:
+                counts[rng.randrange(6)] += 1
+        lines.append(f"{width}x{height}: " + " ".join(str(x) for x in counts))
+    return "\n".join(lines)
+
+
+GENERATORS = {day: globals()[day] for day in days.find_days() if day in globals()}
+
+
+def generate(day, scale=1.0, seed=0):
+    return GENERATORS[day](random.Random(f"{day}:{scale}:{seed}"), scale)
+
+
+def write_input(day, scale=1.0, seed=0, output=None):
+    # Returns the absolute path, which compute_part_*(input_file_name) accepts as is
+    output = output or os.path.join(GENERATED_DIR, day, f"scale-{scale:g}-seed-{seed}.txt")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        f.write(generate(day, scale, seed))
+    return os.path.abspath(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write seeded synthetic puzzle inputs")
+    parser.add_argument("days", nargs="*", help="days to generate (default: all)")
+    parser.add_argument("-s", "--scale", type=float, default=1.0, help="size relative to the real input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (only with a single day)")
+    args = parser.parse_args(argv)
+    for day in args.days or sorted(GENERATORS):
+        print(write_input(day, args.scale, args.seed, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import re
+import subprocess
+import sys
+
+from aoc import days
+
+IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(day):
+    # Import the day in a fresh interpreter so nothing is cached from earlier days
+    code = f"import sys; sys.path.insert(0, {days.ROOT!r}); import {day}.code"
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    modules = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report per-module import time for each day")
+    parser.add_argument("days", nargs="*", help="days to measure (default: all)")
+    parser.add_argument("-n", "--top", type=int, default=3, help="heaviest top-level imports to list per day")
+    args = parser.parse_args(argv)
+    for day in args.days or days.find_days():
+        try:
+            modules = measure(day)
+        except RuntimeError as e:
+            print(f"{day}  failed: {e}")
+            continue
+        total = next(cumulative for name, _, cumulative, _ in modules if name == f"{day}.code")
+        print(f"{day}  {total / 1000:8.2f}ms")
+        # Direct imports of the day module, heaviest first
+        direct = [(name, cumulative) for name, _, cumulative, depth in modules if depth == 1]
+        for name, cumulative in sorted(direct, key=lambda x: -x[1])[:args.top]:
+            print(f"    {name:30} {cumulative / 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import functools
+import time
+
+# Phase timings are only recorded while enabled; disabled spans are a shared no-op
+ENABLED = False
+totals = {}
+
+
+class Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter_ns() - self.start
+        record = totals.setdefault(self.name, [0, 0])
+        record[0] += elapsed
+        record[1] += 1
+        return False
+
+
+class NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+def span(name):
+    return Span(name) if ENABLED else NULL_SPAN
+
+
+def timed(name):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+            with Span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    totals.clear()
+
+
+def snapshot():
+    # {name: (nanoseconds, calls)}
+    return {name: tuple(record) for name, record in totals.items()}
+
+
+def report(phases=None):
+    phases = snapshot() if phases is None else phases
+    return "\n".join(f"{name:12} {ns / 1e6:10.3f}ms  {calls:8} calls" for name, (ns, calls) in phases.items())
@@ -0,0 +1,27 @@
+import importlib
+
+
+class LazyModule:
+    # Stands in for a module and imports it on first attribute access
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        # Later lookups hit the instance dict instead of coming back here
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def resolve(module):
+    # Import a lazy module now, e.g. in a pool initializer rather than in the first timed call
+    if isinstance(module, LazyModule):
+        getattr(module, "__name__")
+    return module
@@ -0,0 +1,70 @@
+import io
+import mmap
+import os
+
+# Text lines are decoded a block of whole lines at a time
+TEXT_BLOCK_BYTES = 1 << 20
+
+
+def read_buffer(input_file):
+    # Map the whole file read-only instead of copying it into Python objects
+    with open(input_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_lines(input_file, keepends=False, view=False, text=False):
+    # Yield one bytes object per line (or a zero-copy memoryview if view=True).
+    # With text=True, yield str lines as a text-mode file would; decoding happens
+    # a block at a time as lines are consumed.
+    buffer = read_buffer(input_file)
+    if text:
+        yield from iter_text_lines(buffer, keepends)
+        return
+    data = memoryview(buffer) if view else buffer
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        stop = size if end == -1 else end + 1
+        yield data[start:stop] if keepends or end == -1 else data[start:end]
+        start = stop
+
+
+def iter_text_blocks(buffer):
+    # Decoded runs of whole lines; blocks end on "\n", so neither a character
+    # nor a "\r\n" is split between two of them
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start + TEXT_BLOCK_BYTES - 1)
+        stop = size if end == -1 else end + 1
+        yield buffer[start:stop].decode()
+        start = stop
+
+
+def iter_text_lines(buffer, keepends=False):
+    # Newlines are translated like in a text-mode file ("\r\n" and "\r" read as "\n")
+    for block in iter_text_blocks(buffer):
+        if keepends:
+            yield from io.StringIO(block, newline=None).readlines()
+        else:
+            lines = io.StringIO(block, newline=None).read().split("\n")
+            last = lines.pop()
+            yield from lines
+            if last:
+                yield last
+
+
+def read_lines(input_file):
+    # Drop-in replacement for f.readlines() on a text file, for days that index
+    # into the lines; single-pass parsers use iter_lines(..., text=True)
+    lines = []
+    for block in iter_text_blocks(read_buffer(input_file)):
+        lines += io.StringIO(block, newline=None).readlines()
+    return lines
+
+
+def iter_text(lines):
+    # Accept str, bytes or memoryview lines from any iterable (file, stdin, generator)
+    for line in lines:
+        yield line if isinstance(line, str) else bytes(line).decode()
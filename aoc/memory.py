@@ -0,0 +1,62 @@
+import contextlib
+import os
+import threading
+import tracemalloc
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss():
+    # Resident set size in bytes; None where /proc is not available
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+class RssSampler(threading.Thread):
+    # Polls the RSS in the background, since the OS only keeps a lifetime maximum
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+
+@contextlib.contextmanager
+def measure(interval=0.01):
+    # Fills in the peak traced Python allocations and the peak RSS (bytes) of the block
+    peaks = {"traced": None, "rss": None}
+    sampler = RssSampler(interval)
+    sampler.start()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield peaks
+    finally:
+        peaks["traced"] = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+        sampler.stop()
+        peaks["rss"] = sampler.peak
+
+
+def format_bytes(n):
+    return "" if n is None else f"{n / 1024 / 1024:.1f}MB"
@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+import time
+
+# Progress is reported only while enabled ($AOC_PROGRESS=1, or =json for one
+# JSON object per update); disabled tasks are a shared no-op
+MODE = os.environ.get("AOC_PROGRESS", "")
+INTERVAL = 0.5
+
+
+class Task:
+    __slots__ = ("name", "total", "done", "best_value", "start", "next_report")
+
+    def __init__(self, name, total=None):
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.best_value = None
+        self.start = time.monotonic()
+        self.next_report = self.start + INTERVAL
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.report(time.monotonic(), final=True)
+        return False
+
+    def advance(self, n=1):
+        self.done += n
+        now = time.monotonic()
+        if now >= self.next_report:
+            self.report(now)
+
+    def best(self, value):
+        self.best_value = value
+
+    def snapshot(self, now):
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else None
+        eta = (self.total - self.done) / rate if rate and self.total is not None else None
+        return {"task": self.name, "done": self.done, "total": self.total, "elapsed": round(elapsed, 3),
+                "rate": rate and round(rate, 1), "eta": eta and round(eta, 1), "best": self.best_value}
+
+    def report(self, now, final=False):
+        self.next_report = now + INTERVAL
+        update = self.snapshot(now)
+        if MODE == "json":
+            line = json.dumps({**update, "final": final}, default=str)
+        else:
+            line = f"{self.name}: {self.done}" + (f"/{self.total}" if self.total is not None else "")
+            if update["rate"] is not None:
+                line += f"  {update['rate']:g}/s"
+            if update["eta"] is not None and not final:
+                line += f"  ETA {update['eta']:g}s"
+            if self.best_value is not None:
+                line += f"  best {self.best_value}"
+            line += f"  {update['elapsed']:g}s" if final else ""
+        print(line, file=sys.stderr, flush=True)
+
+
+class NullTask:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def advance(self, n=1):
+        pass
+
+    def best(self, value):
+        pass
+
+
+NULL_TASK = NullTask()
+
+
+def task(name, total=None):
+    return Task(name, total) if MODE else NULL_TASK
+
+
+def enable(mode="1"):
+    global MODE
+    MODE = mode
+    # Inherited by pool workers started afterwards
+    os.environ["AOC_PROGRESS"] = mode
+
+
+def disable():
+    global MODE
+    MODE = ""
@@ -0,0 +1,175 @@
+import argparse
+import contextlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from aoc import days, instrument, memory, models, progress, sampler
+
+
+def run_function(day, function_name, input_file_name, phases=False, measure_memory=False, profile_interval=None,
+                 fresh_models=True):
+    module = days.load_day(day)
+    function = getattr(module, function_name)
+    if phases:
+        instrument.enable()
+        instrument.reset()
+    # Timed parts parse from scratch instead of reusing a model another part of
+    # the same worker built; batch and the daemon keep models on purpose
+    if fresh_models:
+        models.clear_all()
+    peaks = {"traced": None, "rss": None}
+    stacks = error = None
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+            if measure_memory:
+                peaks = stack.enter_context(memory.measure())
+            if profile_interval:
+                stacks = stack.enter_context(sampler.sample(profile_interval))
+            answer = function(input_file_name)
+    except Exception as e:
+        # Shown in place of the answer; callers that must tell the two apart check "error"
+        answer = error = f"{type(e).__name__}: {e}"
+    return {
+        "day": day,
+        "function": function_name,
+        "answer": answer,
+        "error": error,
+        "wall": time.perf_counter() - wall,
+        "cpu": time.process_time() - cpu,
+        "phases": instrument.snapshot(),
+        "traced": peaks["traced"],
+        "rss": peaks["rss"],
+        "stacks": stacks,
+    }
+
+
+def collect_tasks(selected_days, patterns, input_file_name):
+    tasks = []
+    for day in selected_days:
+        if not os.path.isfile(days.input_path(day, input_file_name)):
+            continue
+        for _, function_name in days.select_functions(day, patterns):
+            tasks.append((day, function_name, input_file_name))
+    return tasks
+
+
+def run(tasks, workers=None, phases=False, measure_memory=False, profile_interval=None):
+    results = []
+    # A fresh worker per part keeps one part's RSS from leaking into the next one's peak
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1 if measure_memory else None) as pool:
+        futures = {pool.submit(run_function, *task, phases, measure_memory, profile_interval): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except BrokenProcessPool as e:
+                # A worker killed by the OS (e.g. out of memory) fails every pending part
+                day, function_name, _ = futures[future]
+                error = f"BrokenProcessPool: {e}"
+                results.append({"day": day, "function": function_name, "answer": error, "error": error,
+                                "wall": None, "cpu": 0.0, "phases": {}, "traced": None, "rss": None, "stacks": None})
+    order = {task[:2]: i for i, task in enumerate(tasks)}
+    return sorted(results, key=lambda result: order[result["day"], result["function"]])
+
+
+def print_table(results, columns=("answer", "wall", "cpu")):
+    header = ["day", "function", *columns]
+    rows = [[result["day"], result["function"], *(format_cell(result[c]) for c in columns)] for result in results]
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))]
+    for row in [header, ["-" * w for w in widths], *rows]:
+        print("  ".join(str(cell).ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def format_cell(value):
+    return f"{value:.3f}s" if isinstance(value, float) else value
+
+
+DEFAULT_PROFILE_DIR = os.path.join(days.ROOT, "profiles")
+PHASE_ORDER = ["read", "parse", "build-index", "solve"]
+
+
+def add_phase_columns(results):
+    # One column per phase name, the usual phases first
+    columns = list(PHASE_ORDER)
+    for result in results:
+        for name, (ns, calls) in result["phases"].items():
+            if name not in columns:
+                columns.append(name)
+            result[name] = f"{ns / 1e6:.3f}ms" + (f" x{calls}" if calls > 1 else "")
+    columns = [name for name in columns if any(name in result["phases"] for result in results)]
+    for result in results:
+        for name in columns:
+            result.setdefault(name, "")
+    return columns
+
+
+def add_memory_columns(results):
+    for result in results:
+        result["peak traced"] = memory.format_bytes(result["traced"])
+        result["peak rss"] = memory.format_bytes(result["rss"])
+    return ["peak traced", "peak rss"]
+
+
+def write_profiles(results, directory, interval, top):
+    for result in results:
+        if not result["stacks"]:
+            continue
+        name = f"{result['day']}.{result['function']}"
+        sampler.write(result["stacks"], os.path.join(directory, name), name, interval)
+        n_samples = sum(result["stacks"].values())
+        print(f"\n{name}: {n_samples} samples, profile in {os.path.join(directory, name)}.speedscope.json")
+        for function, own, total in sampler.hottest(result["stacks"], top):
+            print(f"  {100 * own / n_samples:5.1f}% self  {100 * total / n_samples:5.1f}% total  {function}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run several days' compute_part_* functions in a process pool")
+    parser.add_argument("days", nargs="*", help="days to run, e.g. day01 day09 (default: all)")
+    parser.add_argument("-i", "--input", default="input.txt", help="input file name inside each day directory")
+    parser.add_argument("-f", "--functions", nargs="+", default=days.DEFAULT_PATTERNS,
+                        help="function name patterns (variants infeasible on real inputs only run when named here)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="bypass the on-disk answer cache")
+    parser.add_argument("--phases", action="store_true", help="report time per phase (read, parse, build-index, solve); implies --no-cache")
+    parser.add_argument("--memory", action="store_true", help="report peak traced allocations and peak RSS per part; "
+                        "tracing slows every part down, and implies --no-cache")
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_PROFILE_DIR, metavar="DIR",
+                        help="sample each part's stacks and write collapsed and speedscope files to DIR "
+                        "(default: profiles/); implies --no-cache")
+    parser.add_argument("--interval", type=float, default=sampler.DEFAULT_INTERVAL, help="profiler sampling interval in seconds of CPU time")
+    parser.add_argument("--top", type=int, default=10, help="hot functions listed per profiled part")
+    parser.add_argument("--progress", nargs="?", const="text", choices=["text", "json"],
+                        help="report progress of long loops on stderr, as text or JSON lines; implies --no-cache")
+    parser.add_argument("--max-memory-mb", type=float, help="exit with status 1 if a part's peak traced allocations exceed this")
+    args = parser.parse_args(argv)
+    args.memory = args.memory or args.max_memory_mb is not None
+    if args.progress:
+        progress.enable(args.progress)
+    if args.no_cache or args.phases or args.memory or args.profile or args.progress:
+        # Inherited by the pool workers
+        os.environ["AOC_NO_CACHE"] = "1"
+
+    tasks = collect_tasks(args.days or days.find_days(), args.functions, args.input)
+    start = time.perf_counter()
+    results = run(tasks, args.workers, args.phases, args.memory, args.interval if args.profile else None)
+    print_table(results, ("answer", "wall", "cpu", *(add_phase_columns(results) if args.phases else ()),
+                          *(add_memory_columns(results) if args.memory else ())))
+    print(f"\n{len(results)} parts in {time.perf_counter() - start:.3f}s wall, "
+          f"{sum(result['cpu'] for result in results):.3f}s CPU")
+    if args.profile:
+        write_profiles(results, args.profile, args.interval, args.top)
+    if args.max_memory_mb is not None:
+        over = [result for result in results if (result["traced"] or 0) > args.max_memory_mb * 1024 * 1024]
+        for result in over:
+            print(f"{result['day']} {result['function']}: peak traced {result['peak traced']} "
+                  f"exceeds {args.max_memory_mb:g}MB")
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
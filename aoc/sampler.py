@@ -0,0 +1,96 @@
+import collections
+import contextlib
+import json
+import os
+import signal
+import sys
+
+DEFAULT_INTERVAL = 0.001
+
+
+def label(code):
+    # "day04/code.py:count_neighbor_rolls"; comprehensions and lambdas get their line
+    directory, name = os.path.split(code.co_filename)
+    line = f":{code.co_firstlineno}" if code.co_name.startswith("<") else ""
+    return f"{os.path.basename(directory)}/{name}:{code.co_name}{line}"
+
+
+@contextlib.contextmanager
+def sample(interval=DEFAULT_INTERVAL):
+    # Count the Python stacks seen every `interval` seconds of CPU time, from the
+    # caller's frame inward. Nothing runs between samples, so the overhead stays
+    # small; needs the main thread of a Unix process.
+    stacks = collections.Counter()
+    labels = {}
+    # Stacks stop at the frame that entered this context, past contextlib's own
+    outer = sys._getframe(1)
+    while outer.f_code.co_filename == contextlib.__file__:
+        outer = outer.f_back
+
+    def handle(signum, frame):
+        stack = []
+        # A sample taken while the previous one is still being recorded is dropped
+        if frame.f_code is handle.__code__:
+            return
+        while frame is not None and frame is not outer:
+            code = frame.f_code
+            name = labels.get(code)
+            if name is None:
+                name = labels[code] = label(code)
+            stack.append(name)
+            frame = frame.f_back
+        if stack:
+            stacks[tuple(reversed(stack))] += 1
+
+    previous = signal.signal(signal.SIGPROF, handle)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        yield stacks
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+
+def collapsed(stacks):
+    # Brendan Gregg's folded format, as read by flamegraph.pl and speedscope
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(stacks.items()))
+
+
+def speedscope(stacks, name, interval=DEFAULT_INTERVAL):
+    frames = {}
+    for stack in stacks:
+        for frame in stack:
+            frames.setdefault(frame, len(frames))
+    samples = list(stacks)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(stacks.values()) * interval,
+            "samples": [[frames[frame] for frame in stack] for stack in samples],
+            "weights": [stacks[stack] * interval for stack in samples],
+        }],
+    }
+
+
+def write(stacks, path, name, interval=DEFAULT_INTERVAL):
+    # path without extension; writes path.collapsed and path.speedscope.json
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".collapsed", "w") as f:
+        f.write(collapsed(stacks))
+    with open(path + ".speedscope.json", "w") as f:
+        json.dump(speedscope(stacks, name, interval), f)
+
+
+def hottest(stacks, n=10):
+    # [(function, self samples, total samples)], most self samples first
+    own, total = collections.Counter(), collections.Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for frame in set(stack):
+            total[frame] += count
+    return [(frame, count, total[frame]) for frame, count in own.most_common(n)]
@@ -0,0 +1,132 @@
+import argparse
+import collections
+import contextlib
+import os
+import sys
+
+from aoc import bench, days
+
+# function: name in dayNN/code.py, taking input_file_name like compute_part_*
+# exact: always returns the puzzle answer (False for heuristics that only hold on real inputs)
+# complexity, memory: documentation, shown by --list
+# max_size: largest input feature (see FEATURES) the strategy is allowed to run on, None for no limit
+Strategy = collections.namedtuple("Strategy", "function exact complexity memory max_size", defaults=(None,))
+
+# Candidates per (day, part), in the order to try them when there is no benchmark data.
+# Parts missing here have the single strategy compute_part_N.
+STRATEGIES = {
+    ("day01", 2): [
+        Strategy("compute_part_2", True, "O(rotations)", "O(rotations)"),
+        Strategy("compute_part_2_dummy", True, "O(sum of clicks)", "O(rotations)"),
+    ],
+    ("day02", 1): [
+        Strategy("compute_part_1", True, "O(matching ids)", "O(ranges)"),
+        Strategy("compute_part_1_brute_force", True, "O(ids in all ranges)", "O(ranges)"),
+    ],
+    ("day02", 2): [
+        Strategy("compute_part_2", True, "O(ranges * digits^2)", "O(ranges)"),
+        Strategy("compute_part_2_brute_force", True, "O(ids in all ranges * digits)", "O(ranges)"),
+    ],
+    ("day09", 2): [
+        Strategy("compute_part_2", True, "O(tiles^2 * edges)", "O(tiles)"),
+        Strategy("compute_part_2_inefficient", True, "O(tiles^2 * area)", "O(area)", 10**6),
+    ],
+    ("day12", 1): [
+        Strategy("count_fitting_regions_exact", True, "exponential in region area", "O(area)", 30),
+        Strategy("compute_part_1", False, "O(regions * shapes)", "O(regions)"),
+    ],
+}
+
+
+def input_bytes(module, input_file_name):
+    return os.path.getsize(os.path.join(os.path.dirname(module.__file__), input_file_name))
+
+
+def bounding_box_area(module, input_file_name):
+    numbers = module.parse(input_file_name).numbers
+    return max(x for x, _ in numbers) * max(y for _, y in numbers)
+
+
+def largest_region_area(module, input_file_name):
+    return max((width * height for (width, height), _ in module.parse(input_file_name).regions), default=0)
+
+
+# The input feature that max_size limits, per day; the input size in bytes by default
+FEATURES = {
+    "day09": bounding_box_area,
+    "day12": largest_region_area,
+}
+
+
+def candidates(day, part):
+    return STRATEGIES.get((day, part), [Strategy(f"compute_part_{part}", True, "", "")])
+
+
+def measured_order(day, strategies, baseline):
+    # Sort by total median time over the benchmark inputs every strategy was
+    # measured on; without such shared inputs keep the declared order
+    labels = None
+    for strategy in strategies:
+        prefix = f"{day}.{strategy.function}:"
+        measured = {key[len(prefix):] for key in baseline if key.startswith(prefix)}
+        labels = measured if labels is None else labels & measured
+    if not labels:
+        return list(strategies)
+    return sorted(strategies, key=lambda strategy: sum(baseline[f"{day}.{strategy.function}:{label}"]["median"]
+                                                       for label in labels))
+
+
+def choose(day, part, input_file_name="input.txt", baseline=None, exact=True):
+    # With exact, raise ValueError rather than fall back to a heuristic when no
+    # exact strategy can handle the input
+    module = days.load_day(day)
+    strategies = candidates(day, part)
+    if any(strategy.max_size is not None for strategy in strategies):
+        size = FEATURES.get(day, input_bytes)(module, input_file_name)
+        strategies = [strategy for strategy in strategies if strategy.max_size is None or size <= strategy.max_size]
+    if not any(strategy.exact for strategy in strategies):
+        if exact or not strategies:
+            raise ValueError(f"no exact strategy for {day} part {part} can handle {input_file_name}")
+    else:
+        strategies = [strategy for strategy in strategies if strategy.exact]
+    if baseline is None:
+        baseline = bench.load_baseline(bench.DEFAULT_BASELINE)
+    return measured_order(day, strategies, baseline)[0]
+
+
+def solve(day, part, input_file_name="input.txt", strategy=None, exact=True):
+    # Only a correct answer unless exact=False allows a heuristic as the last resort
+    strategy = strategy or choose(day, part, input_file_name, exact=exact)
+    # Some strategies print progress; only the answer is returned
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return getattr(days.load_day(day), strategy.function)(input_file_name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a part with the fastest strategy that is correct for the input")
+    parser.add_argument("day")
+    parser.add_argument("part", type=int)
+    parser.add_argument("input", nargs="?", default="input.txt", help="input file name inside the day directory")
+    parser.add_argument("--list", action="store_true", help="list the registered strategies instead of solving")
+    parser.add_argument("--allow-heuristic", action="store_true",
+                        help="fall back to a heuristic when no exact strategy can handle the input")
+    args = parser.parse_args(argv)
+    if args.list:
+        for strategy in candidates(args.day, args.part):
+            limit = "" if strategy.max_size is None else f"  up to {strategy.max_size}"
+            print(f"{strategy.function:30} {'exact' if strategy.exact else 'heuristic':9}  "
+                  f"time {strategy.complexity}  memory {strategy.memory}{limit}")
+        return 0
+    try:
+        strategy = choose(args.day, args.part, args.input, exact=not args.allow_heuristic)
+    except ValueError as e:
+        print(f"{e} (--allow-heuristic uses an inexact one)", file=sys.stderr)
+        return 1
+    note = "" if strategy.exact else " (heuristic, the answer may be wrong)"
+    print(f"{args.day} part {args.part} via {strategy.function}{note}", file=sys.stderr)
+    print(solve(args.day, args.part, args.input, strategy))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
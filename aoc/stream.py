@@ -0,0 +1,27 @@
+import argparse
+import sys
+
+from aoc import days
+
+# A day's stream_part_N(lines) solves part N in one pass over any iterable of
+# lines (file handle, stdin, generator), without reading the whole input first
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a part in one pass over the lines of a file or stdin")
+    parser.add_argument("day")
+    parser.add_argument("part", type=int, choices=[1, 2])
+    parser.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    args = parser.parse_args(argv)
+    function = getattr(days.load_day(args.day), f"stream_part_{args.part}", None)
+    if function is None:
+        parser.error(f"{args.day} has no streaming mode for part {args.part}")
+    if args.input == "-":
+        print(function(sys.stdin.buffer))
+    else:
+        with open(args.input, "rb") as f:
+            print(function(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import importlib.util
+import re
+from array import array
+
+from aoc import loader
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+# Below this size importing numpy costs more than it saves
+NUMPY_MIN_BYTES = 1 << 20
+NUMPY_SLICE_BYTES = 1 << 22
+
+TOKEN = re.compile(rb"\d+|\n")
+SIGNED_TOKEN = re.compile(rb"(?<!\d)-?\d+|\n")
+
+
+def integers(buffer, negative=False):
+    # Every integer in buffer as a flat array('q'), plus line offsets so that
+    # values[offsets[k]:offsets[k+1]] are the integers on line k. With negative,
+    # a '-' right before a number that does not follow a digit is its sign.
+    if HAVE_NUMPY and len(buffer) >= NUMPY_MIN_BYTES:
+        return integers_numpy(buffer, negative)
+    values = array("q")
+    offsets = array("q", [0])
+    for token in (SIGNED_TOKEN if negative else TOKEN).findall(buffer):
+        if token == b"\n":
+            offsets.append(len(values))
+        else:
+            values.append(int(token))
+    if len(buffer) and buffer[-1:] != b"\n":
+        offsets.append(len(values))
+    return values, offsets
+
+
+def integers_numpy(buffer, negative=False):
+    # Slices of whole lines keep the temporary arrays bounded however large the
+    # buffer is; the results are appended slice by slice
+    values = array("q")
+    offsets = array("q", [0])
+    begin = 0
+    while begin < len(buffer):
+        newline = buffer.find(b"\n", begin + NUMPY_SLICE_BYTES - 1)
+        end = len(buffer) if newline == -1 else newline + 1
+        numbers, line_offsets = integers_slice(np.frombuffer(buffer, np.uint8, end - begin, begin), negative)
+        line_offsets += len(values)
+        values.frombytes(numbers.tobytes())
+        offsets.frombytes(line_offsets[1:].tobytes())
+        begin = end
+    return values, offsets
+
+
+def integers_slice(data, negative):
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    edges = np.diff(is_digit.view(np.int8), prepend=0, append=0)
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    lengths = ends - starts
+    # Magnitudes are built one digit column at a time in uint64, which holds any
+    # 19-digit number; longer tokens (rare, e.g. leading zeros) are read exactly
+    magnitudes = np.zeros(len(starts), np.uint64)
+    for j in range(min(int(lengths.max(initial=0)), 19)):
+        digits = data[np.minimum(starts + j, ends - 1)] - np.uint8(ord("0"))
+        magnitudes = np.where(lengths > j, magnitudes * np.uint64(10) + digits, magnitudes)
+    signs = np.zeros(len(starts), bool)
+    if negative and len(starts):
+        before = np.where(starts >= 1, data[np.maximum(starts - 1, 0)], 0)
+        before_sign = np.where(starts >= 2, is_digit[np.maximum(starts - 2, 0)], False)
+        signs = (before == ord("-")) & (starts >= 1) & ~before_sign
+    # The same range as array("q"): up to 2**63 - 1, and down to -2**63
+    limits = np.uint64(2**63 - 1) + signs.astype(np.uint64)
+    numbers = magnitudes.astype(np.int64)
+    for k in np.flatnonzero(lengths > 19):
+        magnitude = int(bytes(data[starts[k]:ends[k]]))
+        if magnitude > int(limits[k]):
+            raise OverflowError("integer does not fit into 64 bits")
+        numbers[k] = -magnitude if signs[k] else magnitude
+        signs[k] = False
+    if np.any(magnitudes[lengths <= 19] > limits[lengths <= 19]):
+        raise OverflowError("integer does not fit into 64 bits")
+    # Negating the wrapped magnitude 2**63 gives -2**63, as intended
+    numbers = np.where(signs, -numbers, numbers)
+    line_starts = np.concatenate([[0], np.flatnonzero(data == ord("\n")) + 1])
+    if len(data) == 0 or line_starts[-1] == len(data):
+        line_starts = line_starts[:-1]
+    return numbers, np.append(np.searchsorted(starts, line_starts), len(starts)).astype(np.int64)
+
+
+def read_integers(input_file, negative=False):
+    return integers(loader.read_buffer(input_file), negative)
+
+
+def rows(values, offsets):
+    # The integers of each non-empty line as a list
+    return [values[offsets[k]:offsets[k+1]].tolist() for k in range(len(offsets) - 1) if offsets[k] < offsets[k+1]]
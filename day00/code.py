@@ -1,12 +1,15 @@
 import os.path
 import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader
 
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.iter_lines(input_file, text=True)
 
 
 class Dummy:
@@ -18,12 +21,16 @@ class Dummy:
             pass
 
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
     input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    return 0
+    with instrument.span("parse"):
+        numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
+    with instrument.span("solve"):
+        return 0
 
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
     input = read_input(input_file_name)
     return 0
@@ -1,12 +1,55 @@
+import functools
+import operator
 import os.path
-import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models, tokenize
+from aoc.lazy import lazy_import
 
-def read_input(input_file_name):
+# Only rotation logs of about 1MB or more go through the vectorized engine (the
+# tokenizer has already imported numpy for those), so numpy is imported on first use
+np = lazy_import("numpy")
+NUMPY_MIN_ROTATIONS = 1 << 18
+NUMPY_CHUNK = 1 << 14
+PARALLEL_CHUNK_BYTES = 1 << 22
+
+
+DIRECTIONS = bytes.maketrans(b"LR", b"- ")
+
+def read_rotations(input_file_name):
+    # L/R become signs, so the whole file tokenizes in one pass into signed rotations
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return tokenize.integers(loader.read_buffer(input_file)[:].translate(DIRECTIONS), negative=True)[0]
+
+def iter_rotations(lines):
+    # Lines may be str or bytes, so streamed files need not be decoded first
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield int(line[1:]) if line[:1] in ("R", b"R") else (-1)*int(line[1:])
+
+class Model:
+    def __init__(self, rotations):
+        self.rotations = rotations
+
+    def pack(self):
+        return {"rotations": self.rotations}
+
+    @classmethod
+    def unpack(cls, arrays):
+        return cls(arrays["rotations"])
+
+    @functools.cached_property
+    def index(self):
+        # Window queries over the rotations, see RotationIndex
+        with instrument.span("build-index"):
+            return RotationIndex(self.rotations)
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    with instrument.span("parse"):
+        return Model(read_rotations(input_file_name))
 
 # --- Day 1: Secret Entrance ---
 
@@ -95,18 +138,26 @@ def read_input(input_file_name):
 # Analyze the rotations in your attached document. What's the actual password 
 # to open the door?
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    directions = [[x for x in re.findall(r"L|R", line)][0] for line in input]
-    numbers = [[int(x) for x in re.findall(r"\d+", line)][0] for line in input]
+def count_zero_stops(rotations):
     pos = 50
     res = 0
-    for i in range(len(numbers)):
-        pos += numbers[i] if directions[i] == "R" else (-1)*numbers[i]
+    for rotation in rotations:
+        pos += rotation
         pos %= 100
         res += pos == 0
     return res
 
+@cache.cached
+def compute_part_1(input_file_name="input.txt"):
+    model = parse(input_file_name)
+    with instrument.span("solve"):
+        if tokenize.HAVE_NUMPY and len(model.rotations) >= NUMPY_MIN_ROTATIONS:
+            return count_zero_stops_numpy(model.rotations)
+        return count_zero_stops(model.rotations)
+
+def stream_part_1(lines):
+    return count_zero_stops(iter_rotations(lines))
+
 # 1021
 # That's the right answer! You are one gold star closer to decorating the 
 # North Pole.
@@ -153,33 +204,244 @@ def compute_part_1(input_file_name="input.txt"):
 
 # Using password method 0x434C49434B, what is the password to open the door?
 
+@cache.cached
 def compute_part_2_dummy(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    directions = [[x for x in re.findall(r"L|R", line)][0] for line in input]
-    numbers = [[int(x) for x in re.findall(r"\d+", line)][0] for line in input]
+    model = parse(input_file_name)
     pos = 50
     res = 0
-    for i in range(len(numbers)):
-        for _ in range(numbers[i]):
-            pos += 1 if directions[i] == "R" else (-1)
-            pos %= 100
-            if pos == 0:
-                res += 1
+    with instrument.span("solve"):
+        for rotation in model.rotations:
+            for _ in range(abs(rotation)):
+                pos += 1 if rotation > 0 else (-1)
+                pos %= 100
+                if pos == 0:
+                    res += 1
     return res
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    directions = [[x for x in re.findall(r"L|R", line)][0] for line in input]
-    numbers = [[int(x) for x in re.findall(r"\d+", line)][0] for line in input]
+def count_zero_clicks(rotations):
     pos = 50
     res = 0
-    for i in range(len(numbers)):
+    for rotation in rotations:
+        # R0 and L0 click nothing, even with the dial on 0
+        if not rotation:
+            continue
         old_pos = pos
-        pos += numbers[i] if directions[i] == "R" else (-1)*numbers[i]
+        pos += rotation
         res += abs(pos)//100 + (old_pos*pos<0) + (pos == 0)
         pos %= 100
     return res
 
+def iter_dial_chunks(rotations):
+    # Per chunk of the log: the position before it, its rotations, and the
+    # unwrapped positions after each rotation split into hundreds and a flag for
+    # landing on 0. Chunks stay small enough for the cache; the position is
+    # carried over between them.
+    deltas = np.asarray(rotations, dtype=np.int64)
+    pos = 50
+    for k in range(0, len(deltas), NUMPY_CHUNK):
+        chunk = deltas[k:k+NUMPY_CHUNK]
+        after = np.cumsum(chunk)
+        after += pos
+        # Floor division by a constant is much faster than % in numpy
+        hundreds = after // 100
+        on_zero = hundreds * 100 == after
+        yield pos, chunk, hundreds, on_zero
+        pos = int(after[-1] - 100 * hundreds[-1])
+
+def count_zero_stops_numpy(rotations):
+    return sum(int(np.count_nonzero(on_zero)) for _, _, _, on_zero in iter_dial_chunks(rotations))
+
+def count_zero_clicks_numpy(rotations):
+    # With S the unwrapped position, a right turn passes S_k//100 - S_(k-1)//100
+    # zeros and a left turn (S_(k-1)-1)//100 - (S_k-1)//100: the hundreds crossed,
+    # plus landing on 0, minus leaving from 0
+    res = 0
+    for pos, chunk, hundreds, on_zero in iter_dial_chunks(rotations):
+        left = chunk < 0
+        res += abs(int(hundreds[0])) + int(np.abs(np.diff(hundreds)).sum())
+        res += int(np.count_nonzero(left & on_zero)) - int(np.count_nonzero(left[1:] & on_zero[:-1]))
+        res -= bool(left[0]) and pos == 0
+    return res
+
+class DialSummary:
+    # What a run of rotations does to a dial of `size` positions, for every start
+    # position p: where it ends up (p + offset) and how often it stops at or
+    # passes 0 (stops[p], clicks[p]). Summaries of consecutive runs combine
+    # associatively, so a log can be summarized in chunks in any grouping.
+    def __init__(self, size, offset, stops, clicks):
+        self.size, self.offset, self.stops, self.clicks = size, offset, stops, clicks
+
+    def __add__(self, other):
+        # This run followed by the other one
+        follow = (np.arange(self.size) + self.offset) % self.size
+        return DialSummary(self.size, (self.offset + other.offset) % self.size,
+                           self.stops + other.stops[follow], self.clicks + other.clicks[follow])
+
+def summarize_rotations(rotations, size=100):
+    # The same counting as count_zero_clicks_numpy, with the start position p
+    # left open: with c the cumulative rotations, p + c_k lies floor(c_k/size)
+    # hundreds up, plus one more exactly when c_k mod size >= size - p, and it is
+    # 0 exactly when c_k mod size == -p mod size. Sums over k of such indicators
+    # are weighted bincounts over c mod size, read off at every p at once.
+    deltas = np.asarray(rotations, dtype=np.int64)
+    starts = np.arange(size)
+    if len(deltas) == 0:
+        return DialSummary(size, 0, np.zeros(size, np.int64), np.zeros(size, np.int64))
+    after = np.cumsum(deltas)
+    hundreds, rest = np.divmod(after, size)
+    signs = np.sign(deltas)
+    # Crossings telescope to sum_k hundreds_k * (sign_k - sign_(k+1))
+    weights = signs - np.append(signs[1:], 0)
+    crossed = np.concatenate([[0], np.cumsum(np.bincount(rest, weights, size)[::-1])[:-1]])
+    left = (deltas < 0).astype(np.int64)
+    target = -starts % size
+    stops = np.bincount(rest, minlength=size)[target]
+    clicks = (int(weights @ hundreds) + crossed + np.bincount(rest, left, size)[target]
+              - np.bincount(rest[:-1], left[1:], size)[target] - left[0] * (starts == 0))
+    return DialSummary(size, int(rest[-1]), stops, clicks.astype(np.int64))
+
+def summarize_range(task):
+    # Runs in a worker: summarize the rotations in bytes [begin, end) of the log
+    input_file, begin, end, size = task
+    buffer = loader.read_buffer(input_file)[begin:end].translate(DIRECTIONS)
+    return summarize_rotations(tokenize.integers(buffer, negative=True)[0], size)
+
+def split_lines(buffer, chunk_bytes):
+    # Byte ranges of about chunk_bytes each that start and end on line boundaries
+    begin = 0
+    while begin < len(buffer):
+        newline = buffer.find(b"\n", begin + chunk_bytes - 1)
+        end = len(buffer) if newline == -1 else newline + 1
+        yield begin, end
+        begin = end
+
+def summarize_file(input_file_name="input.txt", workers=None, size=100):
+    # The DialSummary of a whole log: workers map the file and summarize
+    # fixed-size chunks, which are combined in order as they come back, so
+    # memory stays bounded by the chunk size however large the log is
+    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
+    buffer = loader.read_buffer(input_file)
+    tasks = ((input_file, begin, end, size) for begin, end in split_lines(buffer, PARALLEL_CHUNK_BYTES))
+    if len(buffer) <= PARALLEL_CHUNK_BYTES:
+        return functools.reduce(operator.add, map(summarize_range, tasks), summarize_rotations([], size))
+    # Imported here: only huge logs need a pool, and it slows every import of the day
+    import multiprocessing
+    workers = min(workers or os.cpu_count(), -(-len(buffer) // PARALLEL_CHUNK_BYTES))
+    with multiprocessing.Pool(workers) as pool:
+        return functools.reduce(operator.add, pool.imap(summarize_range, tasks), summarize_rotations([], size))
+
+def solve_parallel(input_file_name="input.txt", workers=None, size=100, start=50):
+    # Both parts for a huge log
+    summary = summarize_file(input_file_name, workers, size)
+    return int(summary.stops[start]), int(summary.clicks[start])
+
+def solve_every_start(input_file_name="input.txt", size=100, workers=None):
+    # [(part 1, part 2)] for every start position 0..size-1 of a dial with
+    # `size` positions, from one pass over the log (in parallel with workers)
+    if workers:
+        summary = summarize_file(input_file_name, workers, size)
+    else:
+        with instrument.span("solve"):
+            summary = summarize_rotations(parse(input_file_name).rotations, size)
+    return list(zip(summary.stops.tolist(), summary.clicks.tolist()))
+
+class WaveletMatrix:
+    # Values in [0, 2**bits), each with a few named weights. Sums of a weight over
+    # an index range, restricted to values below x, take one step per bit.
+    def __init__(self, values, weights, bits):
+        values = np.asarray(values, dtype=np.int64)
+        weights = {name: np.asarray(weight, dtype=np.int64) for name, weight in weights.items()}
+        self.bits = bits
+        self.totals = {name: np.concatenate([[0], np.cumsum(weight)]) for name, weight in weights.items()}
+        # Per bit, highest first: how many zero bits precede each index, and the
+        # prefix sums of every weight over the entries with a zero bit
+        self.levels = []
+        for bit in reversed(range(bits)):
+            is_zero = (values >> bit) & 1 == 0
+            zeros = np.concatenate([[0], np.cumsum(is_zero)])
+            sums = {name: np.concatenate([[0], np.cumsum(np.where(is_zero, weight, 0))]) for name, weight in weights.items()}
+            self.levels.append((bit, zeros, int(zeros[-1]), sums))
+            # Entries with a zero bit move to the front, keeping their order
+            order = np.argsort(~is_zero, kind="stable")
+            values = values[order]
+            weights = {name: weight[order] for name, weight in weights.items()}
+
+    def sum(self, lo, hi, name):
+        return int(self.totals[name][hi] - self.totals[name][lo])
+
+    def sum_below(self, lo, hi, x, name):
+        if x >= 1 << self.bits:
+            return self.sum(lo, hi, name)
+        res = 0
+        for bit, zeros, n_zeros, sums in self.levels:
+            lo_zeros, hi_zeros = int(zeros[lo]), int(zeros[hi])
+            if x >> bit & 1:
+                res += int(sums[name][hi] - sums[name][lo])
+                lo, hi = n_zeros + lo - lo_zeros, n_zeros + hi - hi_zeros
+            else:
+                lo, hi = lo_zeros, hi_zeros
+        return res
+
+    def sum_equal(self, lo, hi, x, name):
+        return self.sum_below(lo, hi, x + 1, name) - self.sum_below(lo, hi, x, name)
+
+class RotationIndex:
+    # Stops at and passes of 0 within any window of rotations [i, j), starting
+    # from the dial's actual position or any other one, in O(log size) per query.
+    # Entry 0 is the start, entry k+1 the position after rotation k.
+    #
+    # Starting the window at p instead of the actual position shifts every
+    # position in it by d = p - position(i) mod size. The hundreds crossed then
+    # change by one for each position at or above size - d, and 0 moves to the
+    # positions equal to -d mod size; both are range queries on the positions.
+    def __init__(self, rotations, size=100, start=50):
+        deltas = np.asarray(rotations, dtype=np.int64)
+        self.size = size
+        hundreds, self.positions = np.divmod(np.concatenate([[start], start + np.cumsum(deltas)]), size)
+        signs = np.concatenate([[0], np.sign(deltas)])
+        left = np.concatenate([[0], deltas < 0])
+        self.crossed = np.concatenate([[0], np.cumsum(signs[1:] * np.diff(hundreds))])
+        self.matrix = WaveletMatrix(self.positions, {
+            "stops": np.ones(len(signs), np.int64), "signs": signs, "next_signs": np.append(signs[1:], 0),
+            "left": left, "next_left": np.append(left[1:], 0)}, size.bit_length())
+
+    def __len__(self):
+        return len(self.positions) - 1
+
+    def position(self, i):
+        # The dial's position before rotation i
+        return int(self.positions[i])
+
+    def shift(self, i, start):
+        return 0 if start is None else (start - self.position(i)) % self.size
+
+    def stops(self, i, j, start=None):
+        # How often rotations i..j-1 end on 0
+        d = self.shift(i, start)
+        return self.matrix.sum_equal(i+1, j+1, -d % self.size, "stops")
+
+    def clicks(self, i, j, start=None):
+        # How often the dial points at 0 during rotations i..j-1, as in part 2
+        d = self.shift(i, start)
+        res = int(self.crossed[j] - self.crossed[i])
+        if d:
+            threshold = self.size - d
+            res += (self.matrix.sum(i+1, j+1, "signs") - self.matrix.sum_below(i+1, j+1, threshold, "signs")
+                    - self.matrix.sum(i, j, "next_signs") + self.matrix.sum_below(i, j, threshold, "next_signs"))
+        return res + (self.matrix.sum_equal(i+1, j+1, -d % self.size, "left")
+                      - self.matrix.sum_equal(i, j, -d % self.size, "next_left"))
+
+@cache.cached
+def compute_part_2(input_file_name="input.txt"):
+    model = parse(input_file_name)
+    with instrument.span("solve"):
+        if tokenize.HAVE_NUMPY and len(model.rotations) >= NUMPY_MIN_ROTATIONS:
+            return count_zero_clicks_numpy(model.rotations)
+        return count_zero_clicks(model.rotations)
+
+def stream_part_2(lines):
+    return count_zero_clicks(iter_rotations(lines))
+
 # 5933
 # That's the right answer! You are one gold star closer to decorating the 
 # North Pole.
@@ -1,12 +1,15 @@
 import os.path
 import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models
 
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.read_lines(input_file)
 
 # --- Day 2: Gift Shop ---
 
@@ -64,37 +67,46 @@ def read_input(input_file_name):
 
 # What do you get if you add up all of the invalid IDs?
 
-def compute_part_1_brute_force(input_file_name="input.txt"):
+def get_id_ranges(input):
+    return [[int(x) for x in re.findall(r"\d+", id_range)] for id_range in re.findall(r"\d+\-\d+", input[0])]
+
+class Model:
+    def __init__(self, input):
+        self.id_ranges = get_id_ranges(input)
+
+@models.memoized
+def parse(input_file_name="input.txt"):
     input = read_input(input_file_name)
-    id_ranges = [[x for x in re.findall(r"\d+\-\d+", line)] for line in input][0]
-    n = 0
-    for id_range in id_ranges:
-        range_numbers = [int(x) for x in re.findall(r"\d+", id_range)]
-        start = range_numbers[0]
-        stop = range_numbers[1]
-        for id in range(start, stop+1):
-            str_id = str(id)
-            str_id_len = len(str_id)
-            if str_id_len%2!=0:
-                continue
-            if int(str_id[0:str_id_len//2]) == int(str_id[str_id_len//2:]):
-                n += id
+    with instrument.span("parse"):
+        return Model(input)
+
+@cache.cached
+def compute_part_1_brute_force(input_file_name="input.txt"):
+    id_ranges = parse(input_file_name).id_ranges
+    with instrument.span("solve"):
+        n = 0
+        for start, stop in id_ranges:
+            for id in range(start, stop+1):
+                str_id = str(id)
+                str_id_len = len(str_id)
+                if str_id_len%2!=0:
+                    continue
+                if int(str_id[0:str_id_len//2]) == int(str_id[str_id_len//2:]):
+                    n += id
     return n
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    id_ranges = [[x for x in re.findall(r"\d+\-\d+", line)] for line in input][0]
-    n = 0
-    for id_range in id_ranges:
-        range_numbers = [int(x) for x in re.findall(r"\d+", id_range)]
-        start = range_numbers[0]
-        stop = range_numbers[1]
-        curr = str(start)[:len(str(start))//2] if len(str(start)) % 2 == 0 else ("1" + "0"*((len(str(start))-1)//2))
-        while int(curr + curr) < start:
-            curr = str(int(curr)+1)        
-        while int(curr + curr) <= stop:
-            n += int(curr + curr)
-            curr = str(int(curr)+1)
+    id_ranges = parse(input_file_name).id_ranges
+    with instrument.span("solve"):
+        n = 0
+        for start, stop in id_ranges:
+            curr = str(start)[:len(str(start))//2] if len(str(start)) % 2 == 0 else ("1" + "0"*((len(str(start))-1)//2))
+            while int(curr + curr) < start:
+                curr = str(int(curr)+1)        
+            while int(curr + curr) <= stop:
+                n += int(curr + curr)
+                curr = str(int(curr)+1)
     return n
 
 # 38437576669
@@ -135,22 +147,57 @@ def split_and_check_equal(s, size):
     # Check if all parts are equal
     return len(set(parts)) == 1
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    id_ranges = [[x for x in re.findall(r"\d+\-\d+", line)] for line in input][0]
+@cache.cached
+def compute_part_2_brute_force(input_file_name="input.txt"):
+    id_ranges = parse(input_file_name).id_ranges
+    with instrument.span("solve"):
+        n = 0
+        for start, stop in id_ranges:
+            for id in range(start, stop+1):
+                str_id = str(id)
+                for i in range(len(str_id)//2, 0, -1):
+                   if split_and_check_equal(str_id, i):
+                       n += id
+                       break
+    return n
+
+def mobius(n):
+    res = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            res = -res
+        p += 1
+    return -res if n > 1 else res
+
+def sum_periodic(start, stop, length, period):
+    # Sum of the length-digit IDs in [start, stop] made of one period-digit
+    # pattern repeated: pattern * 11..1 (in base 10**period), an arithmetic progression
+    factor = (10**length - 1) // (10**period - 1)
+    lo = max(10**(period-1), -(-start // factor))
+    hi = min(10**period - 1, stop // factor)
+    return factor * (lo + hi) * (hi - lo + 1) // 2 if lo <= hi else 0
+
+def sum_repeated(start, stop):
+    # IDs that repeat with period d also repeat with every multiple of d that
+    # divides the length, so summing over the proper divisors with Möbius signs
+    # counts every repeated ID exactly once
     n = 0
-    for id_range in id_ranges:
-        range_numbers = [int(x) for x in re.findall(r"\d+", id_range)]
-        start = range_numbers[0]
-        stop = range_numbers[1]
-        for id in range(start, stop+1):
-            str_id = str(id)
-            for i in range(len(str_id)//2, 0, -1):
-               if split_and_check_equal(str_id, i):
-                   n += id
-                   break
+    for length in range(len(str(start)), len(str(stop)) + 1):
+        for period in range(1, length):
+            if length % period == 0:
+                n -= mobius(length // period) * sum_periodic(start, stop, length, period)
     return n
 
+@cache.cached
+def compute_part_2(input_file_name="input.txt"):
+    id_ranges = parse(input_file_name).id_ranges
+    with instrument.span("solve"):
+        return sum(sum_repeated(start, stop) for start, stop in id_ranges)
+
 # 49046150754
 # That's the right answer! You are one gold star closer to decorating the 
 # North Pole.
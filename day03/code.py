@@ -1,12 +1,15 @@
 import os.path
 import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models
 
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.iter_lines(input_file, text=True)
 
 # --- Day 3: Lobby ---
 
@@ -61,10 +64,30 @@ def read_input(input_file_name):
 # There are many batteries in front of you. Find the maximum joltage possible 
 # from each bank; what is the total output joltage?
 
-def compute_part_1(input_file_name="input.txt"):
+def get_bank(line):
+    return [int(x) for x in re.findall(r"\d{1}", line)]
+
+class Model:
+    def __init__(self, input):
+        self.banks = [get_bank(line) for line in input]
+
+@models.memoized
+def parse(input_file_name="input.txt"):
     input = read_input(input_file_name)
-    banks = [[int(x) for x in re.findall(r"\d{1}", line)] for line in input]
-    return sum([max(bank[:-1]) * 10 + max(bank[bank.index(max(bank[:-1]))+1:]) for bank in banks])
+    with instrument.span("parse"):
+        return Model(input)
+
+def get_joltage_part_1(bank):
+    return max(bank[:-1]) * 10 + max(bank[bank.index(max(bank[:-1]))+1:])
+
+@cache.cached
+def compute_part_1(input_file_name="input.txt"):
+    banks = parse(input_file_name).banks
+    with instrument.span("solve"):
+        return sum([get_joltage_part_1(bank) for bank in banks])
+
+def stream_part_1(lines):
+    return sum(get_joltage_part_1(get_bank(line)) for line in loader.iter_text(lines) if line.strip())
 
 # 16887
 # That's the right answer! You are one gold star closer to decorating the 
@@ -108,18 +131,22 @@ def compute_part_1(input_file_name="input.txt"):
 
 # What is the new total output joltage?
 
+def get_joltage_part_2(bank):
+    joltage = 0
+    for k in range(12, 0, -1):
+        joltage *= 10
+        joltage += max(bank[:-k+1] if k > 1 else bank)
+        bank = bank[bank.index(max(bank[:-k+1]))+1:] if k > 1 else bank
+    return joltage
+
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    banks = [[int(x) for x in re.findall(r"\d{1}", line)] for line in input]
-    total = 0
-    for bank in banks:
-        joltage = 0
-        for k in range(12, 0, -1):
-            joltage *= 10
-            joltage += max(bank[:-k+1] if k > 1 else bank)
-            bank = bank[bank.index(max(bank[:-k+1]))+1:] if k > 1 else bank
-        total += joltage
-    return total
+    banks = parse(input_file_name).banks
+    with instrument.span("solve"):
+        return sum(get_joltage_part_2(bank) for bank in banks)
+
+def stream_part_2(lines):
+    return sum(get_joltage_part_2(get_bank(line)) for line in loader.iter_text(lines) if line.strip())
 
 # 167302518850275
 # That's the right answer! You are one gold star closer to decorating the 
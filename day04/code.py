@@ -1,12 +1,15 @@
 import os.path
 import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models
 
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.iter_lines(input_file, text=True)
 
 # --- Day 4: Printing Department ---
 
@@ -66,17 +69,28 @@ def read_input(input_file_name):
 # Consider your complete diagram of the paper roll locations. How many rolls 
 # of paper can be accessed by a forklift?
 
+class Model:
+    def __init__(self, input):
+        self.map = [[x for x in re.findall(r"\.|\@", line)] for line in input]
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input = read_input(input_file_name)
+    with instrument.span("parse"):
+        return Model(input)
+
 def count_neighbor_rolls(map, i, j):
     neighborhood = [row[max(j-1,0):min(len(row),j+2)] for row in map[max(0,i-1):min(len(map),i+2)]]
     return sum(sum(cell.count('@') for cell in row) for row in neighborhood) - 1 if map[i][j] == '@' else 0
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"\.|\@", line)] for line in input]
-    count = 0
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            count += map[i][j] == '@' and count_neighbor_rolls(map, i, j) < 4
+    map = parse(input_file_name).map
+    with instrument.span("solve"):
+        count = 0
+        for i in range(len(map)):
+            for j in range(len(map[i])):
+                count += map[i][j] == '@' and count_neighbor_rolls(map, i, j) < 4
     return count
 
 # 1376
@@ -223,20 +237,22 @@ def compute_part_1(input_file_name="input.txt"):
 # Start with your original diagram. How many rolls of paper in total can be 
 # removed by the Elves and their forklifts?
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"\.|\@", line)] for line in input]
-    total = 0
-    while True:
-        count = 0
-        for i in range(len(map)):
-            for j in range(len(map[i])):
-                if map[i][j] == '@' and count_neighbor_rolls(map, i, j) < 4:
-                    count += 1
-                    map[i][j] = '.'
-        if count == 0:
-            break
-        total += count
+    # Rolls get removed from the map, so work on a copy of the shared model
+    map = [row[:] for row in parse(input_file_name).map]
+    with instrument.span("solve"):
+        total = 0
+        while True:
+            count = 0
+            for i in range(len(map)):
+                for j in range(len(map[i])):
+                    if map[i][j] == '@' and count_neighbor_rolls(map, i, j) < 4:
+                        count += 1
+                        map[i][j] = '.'
+            if count == 0:
+                break
+            total += count
     return total
 
 # 8587
@@ -1,11 +1,10 @@
 import os.path
 import re
+import sys
+from bisect import bisect_right
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models, tokenize
 
 # --- Day 5: Cafeteria ---
 
@@ -60,25 +59,79 @@ def read_input(input_file_name):
 # Process the database file from the new inventory management system. How 
 # many of the available ingredient IDs are fresh?
 
-def get_id_ranges_and_ingredients(input):
+def get_id_ranges_and_ingredients(rows):
     id_ranges = []
     ingredients = []
-    for line in input:
-        if '-' in line:
-            id_ranges.append([int(x) for x in re.findall(r"\d+", line)])
-        elif line != '\n':
-            ingredients.append(int(line))
+    for row in rows:
+        if len(row) == 2:
+            id_ranges.append(row)
+        else:
+            ingredients.append(row[0])
     return id_ranges, ingredients
 
+def read_id_ranges(lines):
+    # Consume the id ranges at the top of lines, up to the blank separator
+    id_ranges = []
+    for line in lines:
+        if '-' not in line:
+            break
+        id_ranges.append([int(x) for x in re.findall(r"\d+", line)])
+    return id_ranges
+
+def merge_id_ranges(id_ranges):
+    merged = []
+    for start, stop in sorted(id_ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return merged
+
+class Model:
+    def __init__(self, rows):
+        self.id_ranges, self.ingredients = get_id_ranges_and_ingredients(rows)
+
+    def pack(self):
+        return {"id_ranges": [x for id_range in self.id_ranges for x in id_range], "ingredients": self.ingredients}
+
+    @classmethod
+    def unpack(cls, arrays):
+        model = cls.__new__(cls)
+        id_ranges = arrays["id_ranges"].tolist()
+        model.id_ranges = [id_ranges[k:k+2] for k in range(0, len(id_ranges), 2)]
+        model.ingredients = arrays["ingredients"]
+        return model
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
+    with instrument.span("parse"):
+        return Model(tokenize.rows(*tokenize.read_integers(input_file)))
+
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    id_ranges, ingredients = get_id_ranges_and_ingredients(input)
+    model = parse(input_file_name)
+    id_ranges, ingredients = model.id_ranges, model.ingredients
+    with instrument.span("solve"):
+        total = 0
+        for id in ingredients:
+            for id_range in id_ranges:
+                if id_range[0] <= id and id <= id_range[1]:
+                    total += 1
+                    break
+    return total
+
+def stream_part_1(lines):
+    # Only the merged id ranges are kept; the ingredient ids stream past
+    lines = loader.iter_text(lines)
+    id_ranges = merge_id_ranges(read_id_ranges(lines))
+    starts = [start for start, _ in id_ranges]
     total = 0
-    for id in ingredients:
-        for id_range in id_ranges:
-            if id_range[0] <= id and id <= id_range[1]:
-                total += 1
-                break
+    for line in lines:
+        if line.strip():
+            id = int(line)
+            k = bisect_right(starts, id) - 1
+            total += k >= 0 and id <= id_ranges[k][1]
     return total
 
 # 782
@@ -110,35 +163,42 @@ def compute_part_1(input_file_name="input.txt"):
 # Process the database file again. How many ingredient IDs are considered to 
 # be fresh according to the fresh ingredient ID ranges?
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    id_ranges, _ = get_id_ranges_and_ingredients(input)
-    # Filter out id ranges that are completely contained in other id ranges
-    id_ranges_to_be_ignored = []
-    for i in range(len(id_ranges)):
-        for j in range(len(id_ranges)):
-            if i != j and id_ranges[j][0] <= id_ranges[i][0] and id_ranges[i][1] <= id_ranges[j][1] and j not in id_ranges_to_be_ignored:
-                # Overlap such as [...<...>...]
-                id_ranges_to_be_ignored.append(i)
-    # Adjust partially overlapping id ranges
-    total_ids = 0
-    for i in range(len(id_ranges)):
-        if i in id_ranges_to_be_ignored:
-            continue
-        for j in range(len(id_ranges)):
-            if i == j or j in id_ranges_to_be_ignored:
+    # The bounds get adjusted in place, so work on a copy of the shared model
+    id_ranges = [id_range[:] for id_range in parse(input_file_name).id_ranges]
+    with instrument.span("build-index"):
+        # Filter out id ranges that are completely contained in other id ranges
+        id_ranges_to_be_ignored = []
+        for i in range(len(id_ranges)):
+            for j in range(len(id_ranges)):
+                if i != j and id_ranges[j][0] <= id_ranges[i][0] and id_ranges[i][1] <= id_ranges[j][1] and j not in id_ranges_to_be_ignored:
+                    # Overlap such as [...<...>...]
+                    id_ranges_to_be_ignored.append(i)
+    with instrument.span("solve"):
+        # Adjust partially overlapping id ranges
+        total_ids = 0
+        for i in range(len(id_ranges)):
+            if i in id_ranges_to_be_ignored:
                 continue
-            if id_ranges[j][0] <= id_ranges[i][0] and id_ranges[i][0] <= id_ranges[j][1]:
-                # Overlap such as [...<...]...>
-                # -> Move:        [......]<...>
-                id_ranges[i][0] = id_ranges[j][1]+1
-            if id_ranges[j][0] <= id_ranges[i][1] and id_ranges[i][1] <= id_ranges[j][1]:
-                # Overlap such as <...[...>...]
-                # -> Move:        <...>[......]
-                id_ranges[i][1] = id_ranges[j][0]-1
-        total_ids += max(0, id_ranges[i][1]-id_ranges[i][0]+1)
+            for j in range(len(id_ranges)):
+                if i == j or j in id_ranges_to_be_ignored:
+                    continue
+                if id_ranges[j][0] <= id_ranges[i][0] and id_ranges[i][0] <= id_ranges[j][1]:
+                    # Overlap such as [...<...]...>
+                    # -> Move:        [......]<...>
+                    id_ranges[i][0] = id_ranges[j][1]+1
+                if id_ranges[j][0] <= id_ranges[i][1] and id_ranges[i][1] <= id_ranges[j][1]:
+                    # Overlap such as <...[...>...]
+                    # -> Move:        <...>[......]
+                    id_ranges[i][1] = id_ranges[j][0]-1
+            total_ids += max(0, id_ranges[i][1]-id_ranges[i][0]+1)
     return total_ids
 
+def stream_part_2(lines):
+    # The ingredient ids are never read
+    return sum(stop - start + 1 for start, stop in merge_id_ranges(read_id_ranges(loader.iter_text(lines))))
+
 # 353863745078671
 # That's the right answer! You are one gold star closer to decorating the 
 # North Pole.
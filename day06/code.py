@@ -1,13 +1,11 @@
 import os.path
 import re
+import sys
 from operator import mul
-from functools import reduce
+from functools import reduce, cached_property
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models, tokenize
 
 # --- Day 6: Trash Compactor ---
 
@@ -58,15 +56,51 @@ def read_input(input_file_name):
 # Solve the problems on the math worksheet. What is the grand total found by 
 # adding together all of the answers to the individual problems?
 
+class Model:
+    def __init__(self, buffer):
+        self.lines = buffer[:].decode().splitlines()
+        # The operations line holds no integers, so only the number rows remain
+        self.numbers = tokenize.rows(*tokenize.integers(buffer))
+        self.operations = [x for x in re.findall(r"\+|\*", self.lines[-1])]
+
+    @cached_property
+    def rearranged_digits(self):
+        # Digits read top to bottom, one list per character column
+        with instrument.span("build-index"):
+            digits = [[x for x in re.findall(r"\d|\s", line)] for line in self.lines[:-1]]
+            return [[digits[j][i] for j in range(len(digits)) if digits[j][i] != ' '] for i in range(len(digits[0]))]
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
+    with instrument.span("parse"):
+        return Model(loader.read_buffer(input_file))
+
 def solve_problem(numbers, op):
     return sum(numbers) if op == "+" else (reduce(mul, numbers) if op == "*" else -1)
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input[:-1]]
-    operations = [x for x in re.findall(r"\+|\*", input[-1])]
-    results = [solve_problem([numbers[j][i] for j in range(len(numbers))], operations[i]) for i in range(len(numbers[0]))]
-    return sum(results)
+    model = parse(input_file_name)
+    numbers, operations = model.numbers, model.operations
+    with instrument.span("solve"):
+        results = [solve_problem([numbers[j][i] for j in range(len(numbers))], operations[i]) for i in range(len(numbers[0]))]
+        return sum(results)
+
+def stream_part_1(lines):
+    # A running sum and product per problem instead of the rows themselves
+    sums, products, operations = [], [], []
+    for line in loader.iter_text(lines):
+        if '+' in line or '*' in line:
+            operations = re.findall(r"\+|\*", line)
+            break
+        for i, x in enumerate(re.findall(r"\d+", line)):
+            if i == len(sums):
+                sums.append(0)
+                products.append(1)
+            sums[i] += int(x)
+            products[i] *= int(x)
+    return sum(sums[i] if op == "+" else products[i] for i, op in enumerate(operations))
 
 # 5381996914800
 # That's the right answer! You are one gold star closer to decorating the 
@@ -104,20 +138,43 @@ def compute_part_1(input_file_name="input.txt"):
 # Solve the problems on the math worksheet again. What is the grand total 
 # found by adding together all of the answers to the individual problems?
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    digits = [[x for x in re.findall(r"\d|\s", line.replace('\n', ''))] for line in input[:-1]]
-    rearranged_digits = [[digits[j][i] for j in range(len(digits)) if digits[j][i] != ' '] for i in range(len(digits[0]))]
-    operations = [x for x in re.findall(r"\+|\*", input[-1])]
-    total, idx, op = 0, 0, 0
-    while idx < len(rearranged_digits):
-        result = int(''.join(rearranged_digits[idx]))
-        while idx + 1 < len(rearranged_digits) and rearranged_digits[idx+1]:
-            idx += 1
-            result = result + int(''.join(rearranged_digits[idx])) if operations[op] == "+" else result * int(''.join(rearranged_digits[idx]))
-        total += result
-        idx += 2
-        op += 1
+    model = parse(input_file_name)
+    rearranged_digits, operations = model.rearranged_digits, model.operations
+    with instrument.span("solve"):
+        total, idx, op = 0, 0, 0
+        while idx < len(rearranged_digits):
+            result = int(''.join(rearranged_digits[idx]))
+            while idx + 1 < len(rearranged_digits) and rearranged_digits[idx+1]:
+                idx += 1
+                result = result + int(''.join(rearranged_digits[idx])) if operations[op] == "+" else result * int(''.join(rearranged_digits[idx]))
+            total += result
+            idx += 2
+            op += 1
+    return total
+
+def stream_part_2(lines):
+    # Every character column accumulates its digits top to bottom into one
+    # number; columns without any digit separate the problems
+    values, operations = [], []
+    for line in loader.iter_text(lines):
+        line = line.rstrip('\n')
+        if '+' in line or '*' in line:
+            operations = re.findall(r"\+|\*", line)
+            break
+        values += [None] * (len(line) - len(values))
+        for i, c in enumerate(line):
+            if c != ' ':
+                values[i] = (values[i] or 0) * 10 + int(c)
+    total, op, result = 0, 0, None
+    for value in values + [None]:
+        if value is not None:
+            result = value if result is None else result + value if operations[op] == "+" else result * value
+        elif result is not None:
+            total += result
+            op += 1
+            result = None
     return total
 
 # 9627174150897
@@ -1,11 +1,14 @@
 import os.path
 import re
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.iter_lines(input_file, text=True)
 
 # --- Day 7: Laboratories ---
 
@@ -157,31 +160,43 @@ def read_input(input_file_name):
 
 # Analyze your manifold diagram. How many times will the beam be split?
 
+class Model:
+    def __init__(self, input):
+        self.map = [[x for x in re.findall(r"S|\.|\^", line)] for line in input]
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input = read_input(input_file_name)
+    with instrument.span("parse"):
+        return Model(input)
+
 def print_map(map):
     for line in map:
         for x in line:
             print(x, end='')
         print("\n")
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"S|\.|\^", line)] for line in input]
-    n_splits = 0
-    for l in range(1, len(map)):
-        for i in range(len(map[l])):
-            match map[l-1][i], map[l][i]:
-                case "S", ".":
-                    map[l][i] = '|'
-                    continue
-                case "|", '.':
-                    map[l][i] = '|'
-                    continue
-                case "|", '^':
-                    map[l][i-1] = "|"
-                    map[l][i+1] = "|"
-                    n_splits += 1
-                    continue
-    return n_splits
+    # Beams are drawn into the map, so work on a copy of the shared model
+    map = [row[:] for row in parse(input_file_name).map]
+    with instrument.span("solve"):
+        n_splits = 0
+        for l in range(1, len(map)):
+            for i in range(len(map[l])):
+                match map[l-1][i], map[l][i]:
+                    case "S", ".":
+                        map[l][i] = '|'
+                        continue
+                    case "|", '.':
+                        map[l][i] = '|'
+                        continue
+                    case "|", '^':
+                        map[l][i-1] = "|"
+                        map[l][i+1] = "|"
+                        n_splits += 1
+                        continue
+        return n_splits
 
 # 1626
 # That's the right answer! You are one gold star closer to decorating the 
@@ -273,31 +288,33 @@ def compute_part_1(input_file_name="input.txt"):
 # manifold diagram. In total, how many different timelines would a single 
 # tachyon particle end up on?
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"S|\.|\^", line)] for line in input]
-    n_timelines = {}
-    for l in range(1, len(map)):
-        for i in range(len(map[l])):
-            match map[l-1][i], map[l][i]:
-                case "S", ".":
-                    map[l][i] = '|'
-                    n_timelines[(l,i)] = 1
-                    continue
-                case "|", '.':
-                    map[l][i] = '|'
-                    n_timelines[(l,i)] = n_timelines[(l-1,i)]
-                    continue
-                case "|", "|":
-                    n_timelines[(l,i)] = n_timelines.get((l,i), 0) + n_timelines[(l-1,i)]
-                case "|", '^':
-                    map[l][i-1] = "|"
-                    n_timelines[(l,i-1)] = n_timelines.get((l,i-1), 0) + n_timelines[(l-1,i)]
-                    map[l][i+1] = "|"
-                    n_timelines[(l,i+1)] = n_timelines.get((l,i+1), 0) + n_timelines[(l-1,i)]
-                    continue
-    total_n_timelines = sum([n_timelines.get((len(map)-1, i), 0) for i in range(len(map[0]))])
-    return total_n_timelines
+    # Beams are drawn into the map, so work on a copy of the shared model
+    map = [row[:] for row in parse(input_file_name).map]
+    with instrument.span("solve"):
+        n_timelines = {}
+        for l in range(1, len(map)):
+            for i in range(len(map[l])):
+                match map[l-1][i], map[l][i]:
+                    case "S", ".":
+                        map[l][i] = '|'
+                        n_timelines[(l,i)] = 1
+                        continue
+                    case "|", '.':
+                        map[l][i] = '|'
+                        n_timelines[(l,i)] = n_timelines[(l-1,i)]
+                        continue
+                    case "|", "|":
+                        n_timelines[(l,i)] = n_timelines.get((l,i), 0) + n_timelines[(l-1,i)]
+                    case "|", '^':
+                        map[l][i-1] = "|"
+                        n_timelines[(l,i-1)] = n_timelines.get((l,i-1), 0) + n_timelines[(l-1,i)]
+                        map[l][i+1] = "|"
+                        n_timelines[(l,i+1)] = n_timelines.get((l,i+1), 0) + n_timelines[(l-1,i)]
+                        continue
+        total_n_timelines = sum([n_timelines.get((len(map)-1, i), 0) for i in range(len(map[0]))])
+        return total_n_timelines
 
 # 48989920237096
 # That's the right answer! You are one gold star closer to decorating the 
@@ -1,13 +1,10 @@
 import os.path
-import re
+import sys
 from math import sqrt
-from functools import reduce
+from functools import reduce, cached_property
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, models, progress, tokenize
 
 # --- Day 8: Playground ---
 
@@ -113,20 +110,48 @@ class JunctionBox:
 
     def print_circuit(self):
         print(str([box.position for box in self.circuit]))
+
+class Model:
+    def __init__(self, positions):
+        self.positions = positions
+
+    def pack(self):
+        return {"positions": [x for position in self.positions for x in position]}
+
+    @classmethod
+    def unpack(cls, arrays):
+        positions = arrays["positions"].tolist()
+        return cls([positions[k:k+3] for k in range(0, len(positions), 3)])
+
+    @cached_property
+    def edges(self):
+        # Index pairs of all junction boxes, closest pair first. Ties keep the
+        # pair order, so this matches repeatedly taking the min distance.
+        with instrument.span("build-index"), progress.task("day08 distances", len(self.positions)) as task:
+            boxes = [JunctionBox(position) for position in self.positions]
+            distances = {}
+            for i in range(len(boxes)):
+                task.advance()
+                for j in range(i+1, len(boxes)):
+                    distances[(i, j)] = boxes[i].get_straight_line_distance_to(boxes[j])
+            return sorted(distances, key=distances.get)
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
+    with instrument.span("parse"):
+        return Model(tokenize.rows(*tokenize.read_integers(input_file)))
        
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    boxes = [JunctionBox([int(x) for x in re.findall(r"\d+", line)]) for line in input]
-    distances = {}
-    for i in range(len(boxes)):
-        for j in range(i+1, len(boxes)):
-            distances[(boxes[i], boxes[j])] = boxes[i].get_straight_line_distance_to(boxes[j])
-    for i in range(1000):
-        box_a, box_b = min(distances, key=distances.get)
-        box_a.connect(box_b)
-        del distances[(box_a, box_b)]
-    largest_circuits = sorted(set([box.get_circuit_representation() for box in boxes]), key=lambda x: x[1], reverse=True)[:3]
-    return reduce(lambda x, y: x * y[1], largest_circuits, 1)
+    model = parse(input_file_name)
+    boxes = [JunctionBox(position) for position in model.positions]
+    edges = model.edges
+    with instrument.span("solve"):
+        for i, j in edges[:1000]:
+            boxes[i].connect(boxes[j])
+        largest_circuits = sorted(set([box.get_circuit_representation() for box in boxes]), key=lambda x: x[1], reverse=True)[:3]
+        return reduce(lambda x, y: x * y[1], largest_circuits, 1)
 
 # 171503
 # That's the right answer! You are one gold star closer to decorating the 
@@ -150,20 +175,18 @@ def compute_part_1(input_file_name="input.txt"):
 # multiply together the X coordinates of the last two junction boxes you need 
 # to connect?
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    boxes = [JunctionBox([int(x) for x in re.findall(r"\d+", line)]) for line in input]
-    distances = {}
-    for i in range(len(boxes)):
-        for j in range(i+1, len(boxes)):
-            distances[(boxes[i], boxes[j])] = boxes[i].get_straight_line_distance_to(boxes[j])
-    while True:
-        box_a, box_b = min(distances, key=distances.get)
-        box_a.connect(box_b)
-        del distances[(box_a, box_b)]
-        # print(f"Circuit Size: {box_a.get_circuit_representation()[1]}/{len(boxes)}")
-        if box_a.get_circuit_representation()[1] == len(boxes):
-            return box_a.position[0]*box_b.position[0]
+    model = parse(input_file_name)
+    boxes = [JunctionBox(position) for position in model.positions]
+    edges = model.edges
+    with instrument.span("solve"), progress.task("day08 part 2", len(edges)) as task:
+        for i, j in edges:
+            boxes[i].connect(boxes[j])
+            task.advance()
+            task.best(len(boxes[i].circuit))
+            if len(boxes[i].circuit) == len(boxes):
+                return boxes[i].position[0]*boxes[j].position[0]
 
 # 9069509600
 # That's the right answer! You are one gold star closer to decorating the 
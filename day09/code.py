@@ -1,12 +1,10 @@
 import os.path
-import re
+import sys
+from functools import cached_property
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, checkpoint, instrument, models, progress, tokenize
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
 
 # --- Day 9: Movie Theater ---
 
@@ -101,10 +99,11 @@ def read_input(input_file_name):
 # Using two red tiles as opposite corners, what is the largest area of any 
 # rectangle you can make?
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    return max([max([(abs(numbers[i][0]-numbers[j][0])+1) * (abs(numbers[i][1]-numbers[j][1])+1) for j in range(i+1, len(numbers))]) for i in range(len(numbers)-1)])
+    numbers = parse(input_file_name).numbers
+    with instrument.span("solve"):
+        return max([max([(abs(numbers[i][0]-numbers[j][0])+1) * (abs(numbers[i][1]-numbers[j][1])+1) for j in range(i+1, len(numbers))]) for i in range(len(numbers)-1)])
 
 # 4741848414
 # That's the right answer! You are one gold star closer to decorating the 
@@ -192,38 +191,60 @@ def compute_part_1(input_file_name="input.txt"):
 # Using two red tiles as opposite corners, what is the largest area of any 
 # rectangle you can make using only red and green tiles?
 
-def check_part_2_criteria(numbers, i, j):
-    x0 = min(numbers[i][0], numbers[j][0])
-    y0 = max(numbers[i][0], numbers[j][0])
-    x1 = min(numbers[i][1], numbers[j][1])
-    y1 = max(numbers[i][1], numbers[j][1])
-    for k in range(i+1, i+len(numbers)):
-        current = numbers[k%len(numbers)]
-        c0 = current[0]
-        c1 = current[1]
-        next = numbers[(k+1)%len(numbers)]
-        n0 = next[0]
-        n1 = next[1]
-        while c0 != n0 or c1 != n1:
-            if (x0 < c0 and c0 < y0) and (x1 < c1 and c1 < y1):
-                # Border goes inside of rectangle!!1!1
-                return False
-            c0 += 1 if c0 < n0 else -1 if c0 > n0 else 0
-            c1 += 1 if c1 < n1 else -1 if c1 > n1 else 0
+class Model:
+    def __init__(self, numbers):
+        self.numbers = numbers
+
+    def pack(self):
+        return {"numbers": [x for number in self.numbers for x in number]}
+
+    @classmethod
+    def unpack(cls, arrays):
+        numbers = arrays["numbers"].tolist()
+        return cls([numbers[k:k+2] for k in range(0, len(numbers), 2)])
+
+    @cached_property
+    def edges(self):
+        # Border segments between consecutive red tiles as (x_min, x_max, y_min, y_max)
+        with instrument.span("build-index"):
+            return [(min(a[0], b[0]), max(a[0], b[0]), min(a[1], b[1]), max(a[1], b[1]))
+                    for a, b in zip(self.numbers, self.numbers[1:] + self.numbers[:1])]
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
+    with instrument.span("parse"):
+        return Model(tokenize.rows(*tokenize.read_integers(input_file)))
+
+def check_part_2_criteria(edges, x0, y0, x1, y1):
+    for e0, f0, e1, f1 in edges:
+        if max(e0, x0+1) <= min(f0, y0-1) and max(e1, x1+1) <= min(f1, y1-1):
+            # Border goes inside of rectangle!!1!1
+            return False
     return True
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    current_max = 0
-    for i in range(len(numbers)-1):
-        print(f"{i}/{len(numbers)}")
-        for j in range(i+1, len(numbers)):
-            candidate_max = (abs(numbers[i][0]-numbers[j][0])+1) * (abs(numbers[i][1]-numbers[j][1])+1)
-            if candidate_max > current_max and check_part_2_criteria(numbers, i, j):
-                print("new max: ", candidate_max)
-                current_max = candidate_max
-    return current_max
+    model = parse(input_file_name)
+    numbers, edges = model.numbers, model.edges
+    with instrument.span("solve"), progress.task("day09 part 2", len(numbers)-1) as task, \
+            checkpoint.Checkpoint(__file__, "compute_part_2", input_file_name) as cp:
+        # Resuming keeps the best area so far, which still prunes the remaining pairs
+        start, current_max = (cp.state or {}).get("i", 0), (cp.state or {}).get("best", 0)
+        task.advance(start)
+        for i in range(start, len(numbers)-1):
+            task.advance()
+            for j in range(i+1, len(numbers)):
+                candidate_max = (abs(numbers[i][0]-numbers[j][0])+1) * (abs(numbers[i][1]-numbers[j][1])+1)
+                if candidate_max > current_max and check_part_2_criteria(edges, 
+                                                                    min(numbers[i][0], numbers[j][0]), 
+                                                                    max(numbers[i][0], numbers[j][0]), 
+                                                                    min(numbers[i][1], numbers[j][1]), 
+                                                                    max(numbers[i][1], numbers[j][1])):
+                    current_max = candidate_max
+                    task.best(current_max)
+            cp.update({"i": i+1, "best": current_max})
+        return current_max
             
 # 1508918480
 # That's the right answer! You are one gold star closer to decorating the 
@@ -236,7 +257,6 @@ def create_map(numbers):
     for k in range(len(numbers)):
         curr = [numbers[k][0], numbers[k][1]]
         next = numbers[(k+1)%len(numbers)]
-        print(curr, next)
         map[curr[1]][curr[0]] = '#'
         while(curr[0] < next[0]):
             curr[0] += 1
@@ -269,23 +289,25 @@ def contains_dot(map, i1, i2, j1, j2):
                 return True
     return False
 
+@cache.cached
 def compute_part_2_inefficient(input_file_name="sample_input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    map = create_map(numbers)
-    print("map created")
-    current_max = 0
-    for i in range(len(numbers)-1):
-        for j in range(i+1, len(numbers)):
-            print(i, j, numbers[i], numbers[j])
-            candidate = (abs(numbers[j][0]-numbers[i][0])+1) * (abs(numbers[j][1]-numbers[i][1])+1)
-            if candidate > current_max and not(contains_dot(map, 
-                                                            min(numbers[i][0], numbers[j][0]), 
-                                                            max(numbers[i][0], numbers[j][0]), 
-                                                            min(numbers[i][1], numbers[j][1]), 
-                                                            max(numbers[i][1], numbers[j][1]))):
-                    current_max = candidate
-    return current_max
+    numbers = parse(input_file_name).numbers
+    with instrument.span("build-index"):
+        map = create_map(numbers)
+    with instrument.span("solve"), progress.task("day09 part 2 (inefficient)", len(numbers)-1) as task:
+        current_max = 0
+        for i in range(len(numbers)-1):
+            task.advance()
+            for j in range(i+1, len(numbers)):
+                candidate = (abs(numbers[j][0]-numbers[i][0])+1) * (abs(numbers[j][1]-numbers[i][1])+1)
+                if candidate > current_max and not(contains_dot(map, 
+                                                                min(numbers[i][0], numbers[j][0]), 
+                                                                max(numbers[i][0], numbers[j][0]), 
+                                                                min(numbers[i][1], numbers[j][1]), 
+                                                                max(numbers[i][1], numbers[j][1]))):
+                        current_max = candidate
+                        task.best(current_max)
+        return current_max
 
 if __name__ == "__main__":
     print(f"PART 1: {compute_part_1()}")
@@ -1,13 +1,18 @@
 import os.path
 import re
+import sys
 
-from pulp import LpProblem, LpVariable, LpInteger, lpSum, LpStatus
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, checkpoint, instrument, loader, models, progress, tokenize
+from aoc.lazy import lazy_import
 
+# Only part 2 needs the ILP solver, so pulp is imported on first use
+pulp = lazy_import("pulp")
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.read_lines(input_file)
 
 # --- Day 10: Factory ---
 
@@ -96,6 +101,36 @@ def read_input(input_file_name):
 # schematics. What is the fewest button presses required to correctly 
 # configure the indicator lights on all of the machines?
 
+class Model:
+    def __init__(self, input):
+        self.diagrams = [[x for x in re.findall(r"\.|\#", line)] for line in input]
+        self.buttons = [[[int(x) for x in re.findall(r"\d+", numbers)] for numbers in re.findall(r"\((.*?)\)", line)] for line in input]
+        self.joltages = [[[int(x) for x in re.findall(r"\d+", numbers)] for numbers in re.findall(r"\{(.*?)\}", line)][0] for line in input]
+
+    def pack(self):
+        # Diagrams and buttons become bit masks over the lights
+        button_masks, button_offsets = models.ragged([[sum(1 << i for i in button) for button in buttons] for buttons in self.buttons])
+        joltages, joltage_offsets = models.ragged(self.joltages)
+        return {"lights": [len(diagram) for diagram in self.diagrams],
+                "diagram_masks": [sum(1 << i for i, x in enumerate(diagram) if x == "#") for diagram in self.diagrams],
+                "button_masks": button_masks, "button_offsets": button_offsets,
+                "joltages": joltages, "joltage_offsets": joltage_offsets}
+
+    @classmethod
+    def unpack(cls, arrays):
+        model = cls([])
+        bits = lambda mask: [i for i in range(mask.bit_length()) if mask >> i & 1]
+        model.diagrams = [["#" if mask >> i & 1 else "." for i in range(n)] for n, mask in zip(arrays["lights"], arrays["diagram_masks"])]
+        model.buttons = [[bits(mask) for mask in masks] for masks in tokenize.rows(arrays["button_masks"], arrays["button_offsets"])]
+        model.joltages = tokenize.rows(arrays["joltages"], arrays["joltage_offsets"])
+        return model
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input = read_input(input_file_name)
+    with instrument.span("parse"):
+        return Model(input)
+
 def recurse(lights, buttons, n_buttons_pressed, diagram):
     if len(buttons) == 0:
         return n_buttons_pressed if all([lights[i] == diagram[i] for i in range(len(lights))]) else 1000
@@ -104,14 +139,16 @@ def recurse(lights, buttons, n_buttons_pressed, diagram):
     switched_lights = [lights[i] if i not in buttons[0] else '#' if lights[i] == '.' else '.' for i in range(len(lights))]
     return min(recurse(switched_lights, buttons[1:], n_buttons_pressed + 1, diagram), recurse(lights, buttons[1:], n_buttons_pressed, diagram))
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    diagrams = [[x for x in re.findall(r"\.|\#", line)] for line in input]
-    buttons = [[[int(x) for x in re.findall(r"\d+", numbers)] for numbers in re.findall(r"\((.*?)\)", line)] for line in input]
-    button_press_sum = 0
-    for i in range(len(diagrams)):
-        button_press_sum += recurse(['.' for _ in range(len(diagrams[i]))], buttons[i], 0, diagrams[i])
-    return button_press_sum
+    model = parse(input_file_name)
+    diagrams, buttons = model.diagrams, model.buttons
+    with instrument.span("solve"), progress.task("day10 part 1", len(diagrams)) as task:
+        button_press_sum = 0
+        for i in range(len(diagrams)):
+            task.advance()
+            button_press_sum += recurse(['.' for _ in range(len(diagrams[i]))], buttons[i], 0, diagrams[i])
+        return button_press_sum
 
 # 479
 # That's the right answer! You are one gold star closer to decorating the 
@@ -188,27 +225,34 @@ def re_recurse(joltages, buttons, n_buttons_pressed, joltage_requirements):
     return min(re_recurse(adjusted_joltages, buttons, n_buttons_pressed+1, joltage_requirements),
                re_recurse(joltages, buttons[1:], n_buttons_pressed, joltage_requirements))
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    buttons = [[[int(x) for x in re.findall(r"\d+", numbers)] for numbers in re.findall(r"\((.*?)\)", line)] for line in input]
-    joltages = [[[int(x) for x in re.findall(r"\d+", numbers)] for numbers in re.findall(r"\{(.*?)\}", line)][0] for line in input]
-    button_press_sum = 0
-    for i in range(len(joltages)):
-        # Create problem
-        problem = LpProblem("Integer_Linear_Program", sense=1)  # sense=1 for minimization
-        # Define variables
-        variables = [LpVariable(f"button_{xi}", lowBound=0, cat=LpInteger) for xi in range(len(buttons[i]))]
-        # Add constraints for each joltage
-        for j in range(len(joltages[i])):
-            lhs = lpSum(variables[xi] for xi in range(len(variables)) if j in buttons[i][xi])  # Sum of relevant variables
-            problem += lhs == joltages[i][j]  # Constraint: lhs must equal the joltage value
-        problem += lpSum(variables) # Objective Function: minimize the sum of variables
-        problem.solve()
-        if LpStatus[problem.status] == "Optimal":
-            button_press_sum += int(sum(var.varValue for var in variables))
-        else:
-            print(f"No solution found for joltage set {i}")
-    return button_press_sum
+    model = parse(input_file_name)
+    buttons, joltages = model.buttons, model.joltages
+    with instrument.span("solve"), progress.task("day10 part 2", len(joltages)) as task, \
+            checkpoint.Checkpoint(__file__, "compute_part_2", input_file_name) as cp:
+        # Button presses of every machine solved so far
+        presses = cp.state or []
+        task.advance(len(presses))
+        for i in range(len(presses), len(joltages)):
+            task.advance()
+            # Create problem
+            problem = pulp.LpProblem("Integer_Linear_Program", sense=1)  # sense=1 for minimization
+            # Define variables
+            variables = [pulp.LpVariable(f"button_{xi}", lowBound=0, cat=pulp.LpInteger) for xi in range(len(buttons[i]))]
+            # Add constraints for each joltage
+            for j in range(len(joltages[i])):
+                lhs = pulp.lpSum(variables[xi] for xi in range(len(variables)) if j in buttons[i][xi])  # Sum of relevant variables
+                problem += lhs == joltages[i][j]  # Constraint: lhs must equal the joltage value
+            problem += pulp.lpSum(variables) # Objective Function: minimize the sum of variables
+            problem.solve()
+            if pulp.LpStatus[problem.status] == "Optimal":
+                presses.append(int(sum(var.varValue for var in variables)))
+            else:
+                print(f"No solution found for joltage set {i}")
+                presses.append(0)
+            cp.update(presses)
+        return sum(presses)
 
 # 19574
 # That's the right answer! You are one gold star closer to decorating the 
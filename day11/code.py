@@ -1,12 +1,15 @@
 import os.path
 import re
+import sys
 from functools import lru_cache
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, instrument, loader, models, tokenize
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.iter_lines(input_file, text=True)
     
 # --- Day 11: Reactor ---
 
@@ -69,6 +72,39 @@ def read_input(input_file_name):
 
 # How many different paths lead from you to out?
 
+class Model:
+    def __init__(self, input):
+        self.devices = {lst[0] : lst[1:] for lst in [[x for x in re.findall(r"[a-z]+", line)] for line in input]}
+
+    def pack(self):
+        # Device names become base-27 integers; one row per device, its outputs after it
+        return dict(zip(("names", "offsets"), models.ragged([[encode(name) for name in [device, *outputs]]
+                                                             for device, outputs in self.devices.items()])))
+
+    @classmethod
+    def unpack(cls, arrays):
+        model = cls([])
+        names = {number: decode(number) for number in set(arrays["names"])}
+        rows = tokenize.rows(arrays["names"], arrays["offsets"])
+        model.devices = {names[row[0]]: [names[x] for x in row[1:]] for row in rows}
+        return model
+
+def encode(name):
+    return sum((ord(c) - 96) * 27**i for i, c in enumerate(name))
+
+def decode(number):
+    name = ""
+    while number:
+        number, c = divmod(number, 27)
+        name += chr(c + 96)
+    return name
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input = read_input(input_file_name)
+    with instrument.span("parse"):
+        return Model(input)
+
 def get_path_count(start, devices, stop):
     queue = [start]
     path_count = 0
@@ -81,10 +117,11 @@ def get_path_count(start, devices, stop):
             queue.append(neighbor)
     return path_count
 
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    devices = {lst[0] : lst[1:] for lst in [[x for x in re.findall(r"[a-z]+", line)] for line in input]}
-    return get_path_count("you", devices, "out")
+    devices = parse(input_file_name).devices
+    with instrument.span("solve"):
+        return get_path_count("you", devices, "out")
 
 # 472
 # That's the right answer! You are one gold star closer to decorating the 
@@ -141,12 +178,13 @@ def get_path_count_fast(start, devices, stop):
         return sum([dfs(neighbor) for neighbor in devices.get(current, [])])
     return dfs(start)
 
+@cache.cached
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    devices = {lst[0] : lst[1:] for lst in [[x for x in re.findall(r"[a-z]+", line)] for line in input]}
-    svr_fft_dac_out = get_path_count_fast("svr", devices, "fft") * get_path_count_fast("fft", devices, "dac") * get_path_count_fast("dac", devices, "out")
-    svr_dac_fft_out = get_path_count_fast("svr", devices, "dac") * get_path_count_fast("dac", devices, "fft") * get_path_count_fast("fft", devices, "out")
-    return svr_fft_dac_out + svr_dac_fft_out
+    devices = parse(input_file_name).devices
+    with instrument.span("solve"):
+        svr_fft_dac_out = get_path_count_fast("svr", devices, "fft") * get_path_count_fast("fft", devices, "dac") * get_path_count_fast("dac", devices, "out")
+        svr_dac_fft_out = get_path_count_fast("svr", devices, "dac") * get_path_count_fast("dac", devices, "fft") * get_path_count_fast("fft", devices, "out")
+        return svr_fft_dac_out + svr_dac_fft_out
 
 # 526811953334940
 # That's the right answer! You are one gold star closer to decorating the 
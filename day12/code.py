@@ -1,14 +1,20 @@
 import os.path
 import re
-import numpy as np
+import sys
 from itertools import product
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import cache, checkpoint, instrument, loader, models, progress
+from aoc.lazy import lazy_import
 
+# Parsing and the area check use plain lists; numpy is only needed by the exact search
+np = lazy_import("numpy")
+
+
+@instrument.timed("read")
 def read_input(input_file_name):
     input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+    return loader.read_lines(input_file)
 
 # --- Day 12: Christmas Tree Farm ---
 
@@ -156,7 +162,7 @@ def parse_input(input):
             while '#' in input[i] or '.' in input[i]:
                 new_shape.append([x for x in input[i].replace('\n', '')])
                 i += 1
-            shapes[idx] = np.array(new_shape)
+            shapes[idx] = new_shape
             i += 1
         else:
             dimensions = [int(x) for x in re.findall(r"\d+", input[i].split(":")[0])]
@@ -165,6 +171,16 @@ def parse_input(input):
             i += 1
     return shapes, regions
 
+class Model:
+    def __init__(self, input):
+        self.shapes, self.regions = parse_input(input)
+
+@models.memoized
+def parse(input_file_name="input.txt"):
+    input = read_input(input_file_name)
+    with instrument.span("parse"):
+        return Model(input)
+
 def generate_unique_transformations(shape):
     transformations = set()
     for rotation in range(4):
@@ -203,22 +219,40 @@ def can_fit(shapes, requirements, grid, width, height):
     return False
 
 def dummy_can_fit(shapes, requirements, width, height):
-    total_area_needed = sum(np.sum(shapes[i] == "#") * requirements[i] for i in range(len(requirements)))
+    total_area_needed = sum(sum(row.count("#") for row in shapes[i]) * requirements[i] for i in range(len(requirements)))
     total_area_available = width * height
     return total_area_needed <= total_area_available
 
+def count_fitting_regions_exact(input_file_name="input.txt"):
+    # The exact search is exponential in the region area; only usable on tiny regions.
+    # A single can_fit search cannot be resumed, so checkpoints hold the finished regions.
+    model = parse(input_file_name)
+    with instrument.span("solve"), progress.task("day12 exact packing", len(model.regions)) as task, \
+            checkpoint.Checkpoint(__file__, "count_fitting_regions_exact", input_file_name) as cp:
+        fits = cp.state or []
+        task.advance(len(fits))
+        for (width, height), requirements in model.regions[len(fits):]:
+            task.advance()
+            fits.append(can_fit(model.shapes, list(requirements), np.full((height, width), "."), width, height))
+            task.best(sum(fits))
+            cp.update(fits)
+        return sum(fits)
+
+@cache.cached
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    shapes, regions = parse_input(input)
-    count = 0
-    for region, requirements in regions:
-        width, height = region
-        # if can_fit(shapes, requirements, np.full((height, width), "."), width, height)
-        # L> would probably solve the sample input
-        if dummy_can_fit(shapes, requirements, width, height):
-            # L> enough to solve the real input
-            count += 1
-    return count
+    model = parse(input_file_name)
+    shapes, regions = model.shapes, model.regions
+    with instrument.span("solve"), progress.task("day12 part 1", len(regions)) as task:
+        count = 0
+        for region, requirements in regions:
+            task.advance()
+            width, height = region
+            # if can_fit(shapes, requirements, np.full((height, width), "."), width, height)
+            # L> would probably solve the sample input
+            if dummy_can_fit(shapes, requirements, width, height):
+                # L> enough to solve the real input
+                count += 1
+        return count
 
 # 495
 # That's the right answer! You are one gold star closer to decorating the 